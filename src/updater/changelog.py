@@ -2,11 +2,24 @@
 
 import re
 from collections.abc import Callable
+from itertools import takewhile
 from pathlib import Path
 from typing import Any
 
 from .exceptions import ChangelogError
 
+# Matches the first versioned section header (e.g. "## v1.2.3")
+_VERSION_RE = re.compile(r"##\s+(v(\d+)\.(\d+)\.(\d+))")
+
+# Matches the start of the first line beginning with "## v"
+_FIRST_VERSION_HEADER_RE = re.compile(r"^## v", re.MULTILINE)
+
+# Matches the "## Unreleased" header line (surrounding whitespace allowed)
+_UNRELEASED_HEADER_RE = re.compile(r"^[^\S\n]*## Unreleased[^\S\n]*$", re.MULTILINE)
+
+# Matches the blank lines and then the bullet lines following the Unreleased header
+_UNRELEASED_BULLETS_RE = re.compile(r"(?:\n[^\S\n]*(?=\n|\Z))*(?:\n[^\S\n]*-[^\n]*)*")
+
 
 def get_unreleased_entries(changelog_path: Path) -> list[str] | None:
     """Parse CHANGELOG.md and return bullet points under ## Unreleased.
@@ -17,32 +30,33 @@ def get_unreleased_entries(changelog_path: Path) -> list[str] | None:
     Returns:
         List of bullet point strings, or None if no Unreleased section or empty
     """
-    if not changelog_path.exists():
+    # Stream lines and stop at the section following ## Unreleased
+    try:
+        with open(changelog_path) as f:
+            lines = map(str.strip, f)
+            # Consume everything up to and including the header (or exhaust the file)
+            next((line for line in lines if line == "## Unreleased"), None)
+            section = takewhile(lambda line: not line.startswith("## "), lines)
+            entries = [line for line in section if line.startswith("- ")]
+    except FileNotFoundError:
         return None
 
-    with open(changelog_path) as f:
-        lines = f.readlines()
+    return entries if entries else None
 
-    # Find ## Unreleased section
-    unreleased_idx = None
-    for i, line in enumerate(lines):
-        if line.strip() == "## Unreleased":
-            unreleased_idx = i
-            break
 
-    if unreleased_idx is None:
-        return None
+def insert_before_first_version(content: str, section: str) -> str:
+    """Insert a section in front of the first ## vX.Y.Z header.
 
-    # Collect bullet points until next ## section or end of file
-    entries: list[str] = []
-    for line in lines[unreleased_idx + 1 :]:
-        stripped = line.strip()
-        if stripped.startswith("## "):
-            break
-        if stripped.startswith("- "):
-            entries.append(stripped)
+    Args:
+        content: Current CHANGELOG.md content
+        section: Section text to insert (a newline is added after it)
 
-    return entries if entries else None
+    Returns:
+        New content; the section goes to the top if no version header exists
+    """
+    version_match = _FIRST_VERSION_HEADER_RE.search(content)
+    insert_pos = version_match.start() if version_match else 0
+    return content[:insert_pos] + section + "\n" + content[insert_pos:]
 
 
 def promote_unreleased_to_version(changelog_path: Path, new_version: str) -> None:
@@ -58,11 +72,11 @@ def promote_unreleased_to_version(changelog_path: Path, new_version: str) -> Non
     Raises:
         ChangelogError: If CHANGELOG.md not found or no Unreleased section
     """
-    if not changelog_path.exists():
-        raise ChangelogError(f"CHANGELOG.md not found at {changelog_path}")
-
-    with open(changelog_path) as f:
-        content = f.read()
+    try:
+        with open(changelog_path) as f:
+            content = f.read()
+    except FileNotFoundError as e:
+        raise ChangelogError(f"CHANGELOG.md not found at {changelog_path}") from e
 
     if "## Unreleased" not in content:
         raise ChangelogError("No ## Unreleased section found in CHANGELOG.md")
@@ -85,23 +99,45 @@ def extract_current_version(changelog_path: Path) -> tuple[int, int, int]:
     Raises:
         ChangelogError: If version cannot be found or parsed
     """
-    if not changelog_path.exists():
-        raise ChangelogError(f"CHANGELOG.md not found at {changelog_path}")
+    try:
+        with open(changelog_path) as f:
+            content = f.read()
+    except FileNotFoundError as e:
+        raise ChangelogError(f"CHANGELOG.md not found at {changelog_path}") from e
+
+    return _extract_version_from_text(content)
 
-    with open(changelog_path) as f:
-        content = f.read()
 
-    version_match = re.search(r"##\s+v(\d+)\.(\d+)\.(\d+)", content)
+def _extract_version_from_text(content: str) -> tuple[int, int, int]:
+    """Extract current version from CHANGELOG.md content already in memory."""
+    version_match = _VERSION_RE.search(content)
     if not version_match:
         raise ChangelogError("Could not find version in CHANGELOG.md")
 
-    major = int(version_match.group(1))
-    minor = int(version_match.group(2))
-    patch = int(version_match.group(3))
+    major = int(version_match.group(2))
+    minor = int(version_match.group(3))
+    patch = int(version_match.group(4))
 
     return major, minor, patch
 
 
+def get_latest_version(changelog_path: Path) -> str | None:
+    """Return the latest version header from CHANGELOG.md.
+
+    Args:
+        changelog_path: Path to CHANGELOG.md
+
+    Returns:
+        Version string of the first ## vX.Y.Z section (e.g., "v1.2.3"),
+        or None if no versioned section exists
+    """
+    with open(changelog_path) as f:
+        content = f.read()
+
+    version_match = _VERSION_RE.search(content)
+    return version_match.group(1) if version_match else None
+
+
 def bump_version(major: int, minor: int, patch: int, bump_type: str) -> str:
     """Calculate new version based on bump type.
 
@@ -153,66 +189,52 @@ def add_to_unreleased(
 
     changelog_path = Path(module_path) / "CHANGELOG.md"
 
-    if not changelog_path.exists():
-        log_func(f"⚠ No CHANGELOG.md found at {changelog_path}, skipping", to_console=True)
-        return
-
     # Read current CHANGELOG
     log_func("→ Reading current CHANGELOG", to_console=config.VERBOSE_MODE)
-    with open(changelog_path) as f:
-        content = f.read()
+    try:
+        with open(changelog_path) as f:
+            content = f.read()
+    except FileNotFoundError:
+        log_func(f"⚠ No CHANGELOG.md found at {changelog_path}, skipping", to_console=True)
+        return
 
-    # Format changelog bullets
-    changelog_bullets = "\n".join(f"- {bullet.lstrip('- ')}" for bullet in analysis["changelog"])
+    # Format changelog bullets (Claude sometimes includes the leading "- ")
+    bullets = [bullet.removeprefix("- ") for bullet in analysis["changelog"]]
+    changelog_bullets = "\n".join(f"- {bullet}" for bullet in bullets)
 
     log_func("\n  Adding to Unreleased:", to_console=config.VERBOSE_MODE)
-    for bullet in analysis["changelog"]:
-        log_func(f"    - {bullet.lstrip('- ')}", to_console=config.VERBOSE_MODE)
-
-    lines = content.split("\n")
-
-    # Find or create ## Unreleased section
-    unreleased_idx = None
-    first_version_idx = None
-
-    for i, line in enumerate(lines):
-        if line.strip() == "## Unreleased":
-            unreleased_idx = i
-            break
-        if line.startswith("## v") and first_version_idx is None:
-            first_version_idx = i
-
-    if unreleased_idx is not None:
-        # Unreleased section exists - append to it
-        # Find the end of existing entries (next ## section or empty line)
-        insert_idx = unreleased_idx + 1
-        # Skip blank lines after ## Unreleased
-        while insert_idx < len(lines) and lines[insert_idx].strip() == "":
-            insert_idx += 1
-        # Find where existing bullets end
-        while insert_idx < len(lines) and lines[insert_idx].strip().startswith("-"):
-            insert_idx += 1
-        # Insert new bullets before the blank line
-        lines.insert(insert_idx, changelog_bullets)
-    else:
+    for bullet in bullets:
+        log_func(f"    - {bullet}", to_console=config.VERBOSE_MODE)
+
+    unreleased_match = _UNRELEASED_HEADER_RE.search(content)
+
+    if unreleased_match is not None:
+        # Unreleased section exists - append after its existing bullets
+        bullets_match = _UNRELEASED_BULLETS_RE.match(content, unreleased_match.end())
+        bullets_end = bullets_match.end() if bullets_match else unreleased_match.end()
+        tail = content[bullets_end:]
+        if tail in ("", "\n"):
+            # Bullets run to the end of the file - append instead of rewriting it
+            with open(changelog_path, "a") as f:
+                f.write(f"{changelog_bullets}\n" if tail else f"\n{changelog_bullets}")
+            log_func("\n✓ Changes added to ## Unreleased", to_console=True)
+            return
+        content = content[:bullets_end] + "\n" + changelog_bullets + tail
+    elif _FIRST_VERSION_HEADER_RE.search(content):
         # Create ## Unreleased section before first version
-        if first_version_idx is not None:
-            new_entry = f"## Unreleased\n\n{changelog_bullets}\n"
-            lines.insert(first_version_idx, new_entry)
-        else:
-            # No versions exist - append after preamble
-            # Find end of preamble (last non-empty line before we'd insert)
-            insert_idx = len(lines)
-            for i in range(len(lines) - 1, -1, -1):
-                if lines[i].strip():
-                    insert_idx = i + 1
-                    break
-            new_entry = f"\n## Unreleased\n\n{changelog_bullets}\n"
-            lines.insert(insert_idx, new_entry)
+        content = insert_before_first_version(content, f"## Unreleased\n\n{changelog_bullets}\n")
+    else:
+        # No versions exist - append after preamble (end of last non-blank line)
+        stripped_len = len(content.rstrip())
+        insert_pos = content.find("\n", stripped_len) if stripped_len else -1
+        if insert_pos == -1:
+            insert_pos = len(content)
+        new_entry = f"\n## Unreleased\n\n{changelog_bullets}\n"
+        content = content[:insert_pos] + "\n" + new_entry + content[insert_pos:]
 
     # Write back
     with open(changelog_path, "w") as f:
-        f.write("\n".join(lines))
+        f.write(content)
 
     log_func("\n✓ Changes added to ## Unreleased", to_console=True)
 
@@ -239,17 +261,17 @@ def update_changelog_with_suggestions(
 
     changelog_path = Path(module_path) / "CHANGELOG.md"
 
-    if not changelog_path.exists():
-        log_func(f"⚠ No CHANGELOG.md found at {changelog_path}, skipping", to_console=True)
-        return None
-
     # Read current CHANGELOG
     log_func("→ Reading current CHANGELOG", to_console=config.VERBOSE_MODE)
-    with open(changelog_path) as f:
-        content = f.read()
+    try:
+        with open(changelog_path) as f:
+            content = f.read()
+    except FileNotFoundError:
+        log_func(f"⚠ No CHANGELOG.md found at {changelog_path}, skipping", to_console=True)
+        return None
 
     # Extract current version
-    major, minor, patch = extract_current_version(changelog_path)
+    major, minor, patch = _extract_version_from_text(content)
     old_version = f"v{major}.{minor}.{patch}"
 
     # Calculate new version
@@ -259,28 +281,21 @@ def update_changelog_with_suggestions(
     log_func(f"  Version bump: {analysis['version_bump']}", to_console=config.VERBOSE_MODE)
     log_func(f"  New version: {new_version}", to_console=config.VERBOSE_MODE)
 
-    # Format changelog bullets
-    changelog_bullets = "\n".join(f"- {bullet.lstrip('- ')}" for bullet in analysis["changelog"])
+    # Format changelog bullets (Claude sometimes includes the leading "- ")
+    bullets = [bullet.removeprefix("- ") for bullet in analysis["changelog"]]
+    changelog_bullets = "\n".join(f"- {bullet}" for bullet in bullets)
 
     log_func("\n  Changelog entry:", to_console=config.VERBOSE_MODE)
-    for bullet in analysis["changelog"]:
-        log_func(f"    - {bullet.lstrip('- ')}", to_console=config.VERBOSE_MODE)
+    for bullet in bullets:
+        log_func(f"    - {bullet}", to_console=config.VERBOSE_MODE)
 
     # Insert new version section
-    lines = content.split("\n")
-
-    insert_idx = 0
-    for i, line in enumerate(lines):
-        if line.startswith("## v"):
-            insert_idx = i
-            break
-
     new_entry = f"## {new_version}\n\n{changelog_bullets}\n"
-    lines.insert(insert_idx, new_entry)
+    content = insert_before_first_version(content, new_entry)
 
     # Write back
     with open(changelog_path, "w") as f:
-        f.write("\n".join(lines))
+        f.write(content)
 
     log_func(f"\n✓ CHANGELOG updated to {new_version}", to_console=True)
 
@@ -1,10 +1,18 @@
 """Claude integration for analyzing changes."""
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import os
-import subprocess
-from collections.abc import Callable
+import random
+import re
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import Any
 
@@ -23,20 +31,163 @@ from .log_manager import log_message
 MAX_DIFF_PER_FILE = 50_000  # 50KB per file
 MAX_TOTAL_DIFF = 200_000  # 200KB total
 
+# Prompt for picking a version bump and changelog bullets from collected diffs
+_ANALYZE_CHANGES_PROMPT = """Analyze these git changes and determine the appropriate version bump.
+
+Module: {module_name}
+{base_info}
+
+Version Bump Decision Rules:
+1. **DEPENDENCY CHANGES = AT LEAST PATCH**
+   - If go.mod, go.sum, package.json, pyproject.toml, or Dockerfile have version updates → PATCH minimum
+
+2. **CODE CHANGES:**
+   - **MAJOR**: Breaking API changes
+   - **MINOR**: New features (backwards-compatible)
+   - **PATCH**: Bug fixes or small improvements
+
+3. **NONE**: ONLY when there are ZERO dependency updates AND ZERO code changes
+   - Examples: .gitignore, README.md, Makefile, docs/
+
+Here are the diffs (truncated if large, generated files excluded):
+
+{diffs}
+
+Task:
+1. Determine version bump based on the diffs above
+2. Create 2-5 concise changelog bullet points
+3. Suggest a brief commit message (max 50 chars)
+
+Return ONLY this JSON format (no markdown, no code blocks):
+{{
+  "version_bump": "patch|minor|major|none",
+  "changelog": ["bullet 1", "bullet 2"],
+  "commit_message": "short message"
+}}"""
+
+# Prompt for picking a version bump from ## Unreleased entries
+_ANALYZE_UNRELEASED_PROMPT = """Analyze these unreleased CHANGELOG entries and determine the appropriate version bump.
+
+Module: {module_name}
+
+Unreleased entries:
+{entries}
+
+Version Bump Rules (Semantic Versioning):
+
+**MAJOR** - Breaking changes that require user action:
+- Removed/renamed public APIs, functions, or CLI flags
+- Changed behavior that breaks existing usage
+- Incompatible configuration changes
+
+**MINOR** - New functionality (backwards-compatible):
+- New features, commands, endpoints, or modes
+- New CLI flags or configuration options
+- New public APIs or functions
+- Significant capability additions
+- Keywords: "add", "new", "support", "implement", "introduce"
+
+**PATCH** - Bug fixes and maintenance:
+- Bug fixes
+- Documentation updates (README, comments)
+- Dependency updates (unless they add features)
+- CI/CD changes, workflow updates
+- Performance improvements (no new features)
+- Refactoring (no behavior change)
+
+IMPORTANT: Lean toward MINOR if any entry adds NEW functionality, even if mixed with patches.
+Example: "Add REST server mode" + "Update README" = MINOR (new feature present)
+
+Return ONLY this JSON format (no markdown, no code blocks):
+{{
+  "version_bump": "patch|minor|major"
+}}"""
+
+# Prompt for turning commit messages into changelog entries
+_CHANGELOG_FROM_COMMITS_PROMPT = """Generate CHANGELOG entries from these git commits.
+
+Module: {module_name}
+
+Commits since last release:
+{commits}
+
+Rules:
+- Create clear, user-facing changelog entries
+- Group related commits into single entries when appropriate
+- Use past tense (e.g., "Added", "Fixed", "Updated")
+- Focus on WHAT changed, not HOW
+- Omit merge commits and trivial changes (typos, formatting)
+- Each entry should be a complete sentence fragment
+
+Return ONLY this JSON format (no markdown, no code blocks):
+{{
+  "entries": [
+    "Add REST server mode for HTTP clients",
+    "Fix race condition in connection pool",
+    "Update Go to 1.26.0"
+  ]
+}}"""
+
+# Attempts per Claude call, and base retry delays in seconds (exponential backoff)
+_MAX_RETRIES = 3
+_RETRY_DELAYS = [2, 5, 10]
+
+# Lowercase error substrings marking a timeout or connection failure worth retrying
+_RETRYABLE_ERRORS = ("timeout", "control request", "connection", "initialize")
+
+# Matches a server-provided retry hint such as "retry-after: 30"
+_RETRY_AFTER_RE = re.compile(r"retry-after\W*(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Longest retry-after hint honoured, in seconds, so a large hint can't stall the run
+_MAX_RETRY_AFTER = 60.0
+
+# Monotonic time the last Claude session closed, None before the first session
+_last_session_end: float | None = None
+
+# Shared session installed by shared_claude_session(), None for a fresh session per query
+_active_pool: ClaudePool | None = None
+
+# Queries sent on one shared connection before it is reconnected
+_POOL_MAX_QUERIES = 10
 
-def _run_git_command(args: list[str], cwd: Path) -> str:
-    """Run a git command and return output, empty string on error."""
+# Dependency files diffed as their own prompt sections
+_DEP_FILES = ("go.mod", "go.sum", "package.json", "pyproject.toml", "Dockerfile")
+
+# Pathspecs keeping vendored and generated files out of the analyzed diff
+_DIFF_EXCLUDES = (
+    ":(glob,exclude)node_modules/**",
+    ":(glob,exclude)vendor/**",
+    ":(glob,exclude)**/mocks/**",
+    ":(glob,exclude)**/*_mock.go",
+    ":(glob,exclude)**/*.gen.go",
+    ":(glob,exclude)**/*.pb.go",
+    ":(glob,exclude)**/*_generated.go",
+)
+
+# Matches the per-file header line of a unified git diff
+_DIFF_HEADER_RE = re.compile(r"^diff --git a/(\S+) b/", re.MULTILINE)
+
+# Matches the body of the first fenced code block, or else the outermost {...} span
+_JSON_PAYLOAD_RE = re.compile(r".*?```(?:json)?(.*?)```|.*?(\{.*\})", re.DOTALL)
+
+
+async def _run_git_command(args: list[str], cwd: Path) -> str:
+    """Run a git command and return output, empty string on error or timeout."""
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
     try:
-        result = subprocess.run(
-            ["git"] + args,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        return result.stdout.strip()
-    except subprocess.TimeoutExpired, subprocess.SubprocessError:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
         return ""
+    # Decode once; diffs may contain bytes that are not valid UTF-8
+    return stdout.decode("utf-8", errors="replace").strip()
 
 
 def _truncate_diff(diff: str, max_size: int, label: str = "") -> str:
@@ -44,70 +195,207 @@ def _truncate_diff(diff: str, max_size: int, label: str = "") -> str:
     if len(diff) <= max_size:
         return diff
     truncated = diff[:max_size]
-    # Try to end at a newline for cleaner output
-    last_newline = truncated.rfind("\n")
-    if last_newline > max_size * 0.8:
+    # Try to end at a newline within the last 20% for cleaner output
+    last_newline = truncated.rfind("\n", int(max_size * 0.8) + 1)
+    if last_newline != -1:
         truncated = truncated[:last_newline]
     suffix = f"\n... [truncated {label}, {len(diff) - len(truncated)} bytes omitted]"
     return truncated + suffix
 
 
-def _get_diff_base(cwd: Path) -> str:
-    """Get the comparison base (latest tag or empty for uncommitted)."""
-    tag = _run_git_command(["describe", "--tags", "--abbrev=0"], cwd)
-    return tag if tag else ""
+def _split_diff_by_file(diff: str) -> tuple[dict[str, str], str]:
+    """Split combined git diff output into per-file sections keyed by path, in diff order.
 
+    Returns:
+        Tuple of (sections by path, any text before the first recognised header)
+    """
+    headers = list(_DIFF_HEADER_RE.finditer(diff))
+    if not headers:
+        return {}, diff.strip()
+    sections: dict[str, str] = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(diff)
+        sections[header.group(1)] = diff[header.start() : end].rstrip()
+    return sections, diff[: headers[0].start()].strip()
 
-def _collect_diffs(module_path: Path) -> dict[str, str]:
-    """Pre-collect and truncate all diffs for analysis."""
-    base = _get_diff_base(module_path)
-    base_args = [base] if base else []
 
-    diffs: dict[str, str] = {}
-    total_size = 0
+def _extract_json(response_text: str) -> str:
+    """Extract the JSON payload from a Claude response in a single regex scan."""
+    match = _JSON_PAYLOAD_RE.match(response_text)
+    if match is None:
+        return response_text
+    payload = match.group(1) if match.group(1) is not None else match.group(2)
+    return payload.strip()
 
-    # Dependency files to check
-    dep_files = ["go.mod", "go.sum", "package.json", "pyproject.toml", "Dockerfile"]
 
-    for dep_file in dep_files:
-        if (module_path / dep_file).exists() or dep_file in ["go.mod", "go.sum"]:
-            diff = _run_git_command(
-                ["diff", "--no-color"] + base_args + ["--", dep_file], module_path
-            )
-            if diff:
-                diff = _truncate_diff(diff, MAX_DIFF_PER_FILE, dep_file)
-                diffs[dep_file] = diff
-                total_size += len(diff)
+def _parse_json_response(response_text: str) -> dict[str, Any]:
+    """Parse the JSON object from a Claude response.
 
-    # General code diff (excluding vendor/node_modules and large generated files)
-    remaining_budget = MAX_TOTAL_DIFF - total_size
-    if remaining_budget > 10000:  # Only if we have reasonable budget left
-        code_diff = _run_git_command(
-            ["diff", "--no-color"]
-            + base_args
-            + [
-                "--",
+    Raises:
+        ClaudeError: If the extracted payload is not a valid JSON object
+    """
+    payload = _extract_json(response_text)
+    try:
+        analysis = json.loads(payload)
+    except json.JSONDecodeError as e:
+        raise ClaudeError(
+            f"Failed to parse Claude response as JSON: {e}\nResponse: {payload}"
+        ) from e
+    if not isinstance(analysis, dict):
+        raise ClaudeError(f"Claude response is not a JSON object\nResponse: {payload}")
+    return analysis
+
+
+async def _get_diff_base(cwd: Path) -> str:
+    """Get the comparison base (latest tag or empty for uncommitted)."""
+    tag = await _run_git_command(["describe", "--tags", "--abbrev=0"], cwd)
+    return tag if tag else ""
+
+
+async def _collect_diffs(module_path: Path, base: str) -> tuple[str, bool]:
+    """Pre-collect and truncate all diffs for analysis against the given base.
+
+    Returns:
+        Tuple of (prompt-ready "=== name ===" sections joined by blank lines,
+        whether git reported any changes at all)
+    """
+    # Pin the header format regardless of the user's git config (mnemonicPrefix,
+    # noprefix, quotePath), so dependency sections can be split reliably
+    diff_args = [
+        "-c",
+        "core.quotePath=false",
+        "diff",
+        "--no-color",
+        "--relative",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        *([base] if base else []),
+        "--",
+    ]
+
+    # Dependency files in one diff, split per file below; the code diff excludes
+    # them (and vendor/node_modules and large generated files) and is used as is
+    dep_output, code_output = await asyncio.gather(
+        _run_git_command([*diff_args, *_DEP_FILES], module_path),
+        _run_git_command(
+            [
+                *diff_args,
                 ".",
-                ":(exclude)node_modules/**",
-                ":(exclude)vendor/**",
-                ":(exclude)**/mocks/**",
-                ":(exclude)**/*_mock.go",
-                ":(exclude)**/*.gen.go",
+                *_DIFF_EXCLUDES,
+                *(f":(exclude){dep_file}" for dep_file in _DEP_FILES),
             ],
             module_path,
-        )
-        if code_diff:
-            code_diff = _truncate_diff(code_diff, remaining_budget, "code changes")
-            diffs["code_changes"] = code_diff
+        ),
+    )
+    file_diffs, unparsed = _split_diff_by_file(dep_output)
+
+    sections: list[str] = []
+    total_size = 0
+
+    for dep_file in _DEP_FILES:
+        diff = file_diffs.pop(dep_file, "")
+        if diff:
+            diff = _truncate_diff(diff, MAX_DIFF_PER_FILE, dep_file)
+            sections.append(f"=== {dep_file} ===\n{diff}")
+            total_size += len(diff)
+
+    # Anything the split didn't attribute to a dependency file goes with the code
+    code_diff = "\n".join(part for part in (unparsed, *file_diffs.values(), code_output) if part)
+    remaining_budget = MAX_TOTAL_DIFF - total_size
+    if remaining_budget > 10000 and code_diff:  # Only if we have reasonable budget left
+        code_diff = _truncate_diff(code_diff, remaining_budget, "code changes")
+        sections.append(f"=== code_changes ===\n{code_diff}")
+
+    return "\n\n".join(sections), bool(dep_output or code_output)
+
+
+def _is_retryable(error_str: str) -> bool:
+    """Check whether a Claude error is a timeout or connection failure worth retrying."""
+    lowered = error_str.lower()
+    return any(keyword in lowered for keyword in _RETRYABLE_ERRORS)
+
+
+def _backoff_delay(attempt: int, error_str: str) -> float:
+    """Get the delay before retrying after a failed attempt.
+
+    Honours a retry-after hint in the error, capped at _MAX_RETRY_AFTER;
+    otherwise jitters the base delay by ±25% so parallel sessions hitting the
+    same failure do not retry in lockstep.
+    """
+    match = _RETRY_AFTER_RE.search(error_str)
+    if match:
+        return min(float(match.group(1)), _MAX_RETRY_AFTER)
+    return _RETRY_DELAYS[attempt] * random.uniform(0.75, 1.25)
+
+
+async def _wait_for_session_gap() -> None:
+    """Sleep until CLAUDE_SESSION_DELAY has passed since the previous session closed.
+
+    The delay only separates consecutive sessions, so a run's first and last
+    sessions pay nothing.
+    """
+    if _last_session_end is None:
+        return
+    remaining = config.CLAUDE_SESSION_DELAY - (time.monotonic() - _last_session_end)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
 
-    return diffs
 
+def _mark_session_end() -> None:
+    """Record that a Claude session has just closed."""
+    global _last_session_end
+    _last_session_end = time.monotonic()
 
+
+def _cache_path(prompt: str) -> Path:
+    """Get the on-disk cache file for a prompt sent to the configured model."""
+    digest = hashlib.sha256(f"{config.MODEL}\n{prompt}".encode()).hexdigest()
+    return Path.home() / ".cache" / "updater" / "claude" / digest[:2] / f"{digest}.json"
+
+
+def _read_cached_analysis(prompt: str) -> dict[str, Any] | None:
+    """Return the cached analysis for a prompt, or None if disabled, missing or expired."""
+    if not config.CLAUDE_CACHE_ENABLED:
+        return None
+    cache_path = _cache_path(prompt)
+    try:
+        if time.time() - cache_path.stat().st_mtime > config.CLAUDE_CACHE_MAX_AGE:
+            return None
+        cached: dict[str, Any] = json.loads(cache_path.read_text())
+        return cached
+    except OSError, json.JSONDecodeError:
+        return None
+
+
+def _write_cached_analysis(prompt: str, analysis: dict[str, Any]) -> None:
+    """Store an analysis for a prompt; the cache is best-effort and never fails a run."""
+    if not config.CLAUDE_CACHE_ENABLED:
+        return
+    cache_path = _cache_path(prompt)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named temp file and rename, so readers never see a
+        # partial entry and concurrent writers of the same key never share a temp file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_path.parent, prefix=f"{cache_path.stem}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps(analysis))
+        try:
+            os.replace(tmp.name, cache_path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    except OSError:
+        pass
+
+
+@functools.cache
 def _get_clean_config_dir() -> Path | None:
     """Get the clean config directory for Claude if it exists.
 
     Only uses ~/.claude-clean if it was explicitly created by the user.
-    Falls back to default Claude config otherwise.
+    Falls back to default Claude config otherwise. The result is cached for
+    the lifetime of the process.
 
     Returns:
         Path to the clean config directory, or None to use default
@@ -124,6 +412,173 @@ def _get_clean_config_dir() -> Path | None:
     return clean_config_dir
 
 
+@functools.cache
+def _claude_env() -> dict[str, str]:
+    """Build the environment for Claude sessions once per process.
+
+    The SDK only reads this mapping, so the same dict is shared by all sessions.
+
+    Returns:
+        Copy of os.environ with CLAUDE_CONFIG_DIR set when a clean config exists
+    """
+    env = os.environ.copy()
+    clean_config_dir = _get_clean_config_dir()
+    if clean_config_dir is not None:
+        env["CLAUDE_CONFIG_DIR"] = str(clean_config_dir)
+    return env
+
+
+@functools.cache
+def _claude_options(model: str | None) -> ClaudeCodeOptions:
+    """Build the Claude session options once per model.
+
+    The SDK copies options before changing them, so sessions and retries share one instance.
+
+    Args:
+        model: Claude model name, or None for the CLI default
+
+    Returns:
+        Options using the shared Claude environment
+    """
+    return ClaudeCodeOptions(model=model, env=_claude_env())
+
+
+async def _receive_text(client: ClaudeSDKClient) -> str:
+    """Collect the text blocks of the client's next response into one string."""
+    response_parts: list[str] = []
+    async for message in client.receive_response():
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    response_parts.append(block.text)
+    return "".join(response_parts)
+
+
+class ClaudePool:
+    """One lazily connected Claude session shared by consecutive queries.
+
+    Skips the per-query session setup while each query starts its own
+    conversation, so one module's diff never reaches another module's answer.
+    The connection is renewed every _POOL_MAX_QUERIES queries, and a failed
+    query drops it so the next one reconnects. Concurrent queries take turns
+    on the session.
+    """
+
+    def __init__(self) -> None:
+        self._client: ClaudeSDKClient | None = None
+        self._lock = asyncio.Lock()
+        self._queries = 0
+        self._connection_queries = 0
+
+    async def __aenter__(self) -> ClaudePool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def query(self, prompt: str) -> str:
+        """Send a prompt as a fresh conversation on the shared session and return the response text."""
+        async with self._lock:
+            if self._connection_queries >= _POOL_MAX_QUERIES:
+                await self.close()
+            if self._client is None:
+                client = ClaudeSDKClient(options=_claude_options(config.MODEL))
+                await client.connect()
+                self._client = client
+                self._connection_queries = 0
+            self._queries += 1
+            self._connection_queries += 1
+            try:
+                await self._client.query(prompt, session_id=f"query-{self._queries}")
+                return await _receive_text(self._client)
+            except Exception:
+                await self.close()
+                raise
+
+    async def close(self) -> None:
+        """Disconnect the shared session if one is open."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.disconnect()
+
+
+@contextlib.asynccontextmanager
+async def shared_claude_session() -> AsyncIterator[ClaudePool]:
+    """Route Claude queries without an explicit pool through one shared session."""
+    global _active_pool
+    async with ClaudePool() as pool:
+        _active_pool = pool
+        try:
+            yield pool
+        finally:
+            _active_pool = None
+
+
+async def _query_claude(prompt: str, pool: ClaudePool | None) -> str:
+    """Send a prompt to Claude and return the response text.
+
+    Uses the given or active shared session if there is one, otherwise a fresh
+    session per query, spaced CLAUDE_SESSION_DELAY apart.
+    """
+    pool = pool or _active_pool
+    if pool is not None:
+        return await pool.query(prompt)
+
+    await _wait_for_session_gap()
+    try:
+        # Create new client for clean session
+        async with ClaudeSDKClient(options=_claude_options(config.MODEL)) as client:
+            await client.query(prompt)
+            response_text = await _receive_text(client)
+    finally:
+        # Remember when the session closed so the next one can keep its distance
+        _mark_session_end()
+    return response_text
+
+
+async def _query_json_with_retries(
+    prompt: str,
+    pool: ClaudePool | None,
+    log_func: Callable[..., None],
+    failure_message: str,
+) -> dict[str, Any]:
+    """Query Claude and parse its JSON reply, retrying timeouts with backoff.
+
+    Args:
+        prompt: Prompt to send
+        pool: Shared Claude session to use instead of a fresh one
+        log_func: Logging function to use
+        failure_message: Prefix for the ClaudeError raised on failure
+
+    Returns:
+        Parsed JSON object from the response
+
+    Raises:
+        ClaudeError: On a non-retryable error or after all retries
+    """
+    last_error = None
+    for attempt in range(_MAX_RETRIES):
+        try:
+            return _parse_json_response(await _query_claude(prompt, pool))
+        except Exception as e:
+            if _is_retryable(str(e)) and attempt < _MAX_RETRIES - 1:
+                delay = _backoff_delay(attempt, str(e))
+                log_func(
+                    f"→ Timeout error (attempt {attempt + 1}/{_MAX_RETRIES}), "
+                    f"retrying in {delay:.1f}s...",
+                    to_console=True,
+                )
+                await asyncio.sleep(delay)
+                last_error = e
+                continue
+            else:
+                # Non-retryable error or final attempt - raise
+                raise ClaudeError(f"{failure_message}: {e}") from e
+
+    # Should never reach here, but just in case
+    raise ClaudeError(f"{failure_message} after {_MAX_RETRIES} attempts") from last_error
+
+
 async def verify_claude_auth() -> tuple[bool, str]:
     """Verify Claude authentication is working.
 
@@ -134,20 +589,10 @@ async def verify_claude_auth() -> tuple[bool, str]:
     """
     clean_config_dir = _get_clean_config_dir()
 
-    env = os.environ.copy()
-    if clean_config_dir is not None:
-        env["CLAUDE_CONFIG_DIR"] = str(clean_config_dir)
-
-    options = ClaudeCodeOptions(
-        model=config.MODEL,
-        env=env,
-    )
+    options = _claude_options(config.MODEL)
 
     # Retry logic for timeout errors
-    max_retries = 3
-    retry_delays = [2, 5, 10]  # seconds - exponential backoff
-
-    for attempt in range(max_retries):
+    for attempt in range(_MAX_RETRIES):
         try:
             async with ClaudeSDKClient(options=options) as client:
                 await client.query("Reply with exactly: ok")
@@ -171,14 +616,8 @@ async def verify_claude_auth() -> tuple[bool, str]:
                     "Fix: Run 'claude login' to authenticate."
                 )
 
-            # Check if it's a timeout or connection error worth retrying
-            is_retryable = any(
-                keyword in error_str.lower()
-                for keyword in ["timeout", "control request", "connection", "initialize"]
-            )
-
-            if is_retryable and attempt < max_retries - 1:
-                delay = retry_delays[attempt]
+            if _is_retryable(error_str) and attempt < _MAX_RETRIES - 1:
+                delay = _backoff_delay(attempt, error_str)
                 # Note: No logging here since this is called during startup
                 await asyncio.sleep(delay)
                 continue
@@ -190,16 +629,20 @@ async def verify_claude_auth() -> tuple[bool, str]:
 
 
 async def analyze_changes_with_claude(
-    module_path: Path, log_func: Callable[..., None] = log_message
+    module_path: Path,
+    log_func: Callable[..., None] = log_message,
+    pool: ClaudePool | None = None,
 ) -> dict[str, Any]:
     """Ask Claude to analyze changes and suggest version bump + changelog bullets.
 
-    Creates a new Claude session for each module to ensure clean analysis.
+    Creates a new Claude session for each module to ensure clean analysis,
+    unless a shared session pool is given or active.
     Retries up to 3 times on timeout errors with exponential backoff.
 
     Args:
         module_path: Path to the module
         log_func: Logging function to use
+        pool: Shared Claude session to use instead of a fresh one
 
     Returns:
         Dict with keys: version_bump, changelog, commit_message
@@ -211,142 +654,49 @@ async def analyze_changes_with_claude(
     log_func("→ Collecting diffs...", to_console=config.VERBOSE_MODE)
 
     # Pre-collect diffs to avoid Claude SDK buffer overflow
-    diffs = _collect_diffs(module_path)
-    base = _get_diff_base(module_path)
+    base = await _get_diff_base(module_path)
+    all_diffs, has_changes = await _collect_diffs(module_path, base)
+    if not has_changes:
+        # git reported nothing Claude could base a bump on (e.g. only vendor or
+        # generated files changed)
+        log_func("→ No diffs to analyze, skipping Claude", to_console=True)
+        return {
+            "version_bump": "none",
+            "changelog": [],
+            "commit_message": "update dependencies",
+        }
+    if not all_diffs:
+        # Never turn changes we failed to collect into a silent "none" bump
+        raise ClaudeError(f"git reported changes in {module_path} but no diff could be collected")
     base_info = f"Comparing against tag: {base}" if base else "Comparing uncommitted changes"
 
-    # Build diff section for prompt
-    diff_sections = []
-    for name, diff in diffs.items():
-        diff_sections.append(f"=== {name} ===\n{diff}")
-    all_diffs = "\n\n".join(diff_sections) if diff_sections else "(no changes detected)"
-
     log_func("→ Analyzing changes...", to_console=config.VERBOSE_MODE)
 
-    prompt = f"""Analyze these git changes and determine the appropriate version bump.
-
-Module: {module_path.name}
-{base_info}
-
-Version Bump Decision Rules:
-1. **DEPENDENCY CHANGES = AT LEAST PATCH**
-   - If go.mod, go.sum, package.json, pyproject.toml, or Dockerfile have version updates → PATCH minimum
-
-2. **CODE CHANGES:**
-   - **MAJOR**: Breaking API changes
-   - **MINOR**: New features (backwards-compatible)
-   - **PATCH**: Bug fixes or small improvements
-
-3. **NONE**: ONLY when there are ZERO dependency updates AND ZERO code changes
-   - Examples: .gitignore, README.md, Makefile, docs/
-
-Here are the diffs (truncated if large, generated files excluded):
-
-{all_diffs}
-
-Task:
-1. Determine version bump based on the diffs above
-2. Create 2-5 concise changelog bullet points
-3. Suggest a brief commit message (max 50 chars)
-
-Return ONLY this JSON format (no markdown, no code blocks):
-{{
-  "version_bump": "patch|minor|major|none",
-  "changelog": ["bullet 1", "bullet 2"],
-  "commit_message": "short message"
-}}"""
-
-    # Retry logic for timeout errors
-    max_retries = 3
-    retry_delays = [2, 5, 10]  # seconds - exponential backoff
-
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            clean_config_dir = _get_clean_config_dir()
-            env = os.environ.copy()
-            if clean_config_dir is not None:
-                env["CLAUDE_CONFIG_DIR"] = str(clean_config_dir)
-
-            options = ClaudeCodeOptions(
-                model=config.MODEL,
-                env=env,
-            )
+    prompt = _ANALYZE_CHANGES_PROMPT.format(
+        module_name=module_path.name, base_info=base_info, diffs=all_diffs
+    )
 
-            response_text = ""
+    cached = _read_cached_analysis(prompt)
+    if cached is not None:
+        log_func("→ Using cached analysis for identical changes", to_console=True)
+        return cached
 
-            # Create new client for clean session per module
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
+    analysis = await _query_json_with_retries(prompt, pool, log_func, "Claude analysis failed")
 
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                response_text += block.text
-
-            # Parse JSON response
-            # Extract JSON from response (handle markdown code blocks and plain text)
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            else:
-                # No code blocks - find JSON by braces
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end].strip()
-
-            try:
-                analysis = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                raise ClaudeError(
-                    f"Failed to parse Claude response as JSON: {e}\nResponse: {response_text}"
-                ) from e
-
-            return {
-                "version_bump": analysis.get("version_bump", "patch"),
-                "changelog": analysis.get("changelog", ["go mod update"]),
-                "commit_message": analysis.get("commit_message", "update dependencies"),
-            }
-
-        except Exception as e:
-            error_str = str(e).lower()
-            # Check if it's a timeout or connection error worth retrying
-            is_retryable = any(
-                keyword in error_str
-                for keyword in ["timeout", "control request", "connection", "initialize"]
-            )
-
-            if is_retryable and attempt < max_retries - 1:
-                delay = retry_delays[attempt]
-                log_func(
-                    f"→ Timeout error (attempt {attempt + 1}/{max_retries}), "
-                    f"retrying in {delay}s...",
-                    to_console=True,
-                )
-                await asyncio.sleep(delay)
-                last_error = e
-                continue
-            else:
-                # Non-retryable error or final attempt - raise
-                raise ClaudeError(f"Claude analysis failed: {e}") from e
-
-        finally:
-            # Small delay to allow cleanup between sessions
-            await asyncio.sleep(config.CLAUDE_SESSION_DELAY)
-
-    # Should never reach here, but just in case
-    raise ClaudeError(f"Claude analysis failed after {max_retries} attempts") from last_error
+    result = {
+        "version_bump": analysis.get("version_bump", "patch"),
+        "changelog": analysis.get("changelog", ["go mod update"]),
+        "commit_message": analysis.get("commit_message", "update dependencies"),
+    }
+    _write_cached_analysis(prompt, result)
+    return result
 
 
 async def analyze_unreleased_for_release(
-    entries: list[str], module_name: str, log_func: Callable[..., None] = log_message
+    entries: list[str],
+    module_name: str,
+    log_func: Callable[..., None] = log_message,
+    pool: ClaudePool | None = None,
 ) -> dict[str, Any]:
     """Ask Claude to determine version bump from unreleased changelog entries.
 
@@ -354,6 +704,7 @@ async def analyze_unreleased_for_release(
         entries: List of bullet point strings from ## Unreleased section
         module_name: Name of the module being released
         log_func: Logging function to use
+        pool: Shared Claude session to use instead of a fresh one
 
     Returns:
         Dict with keys: version_bump, commit_message
@@ -365,125 +716,28 @@ async def analyze_unreleased_for_release(
 
     bullets = "\n".join(entries)
 
-    prompt = f"""Analyze these unreleased CHANGELOG entries and determine the appropriate version bump.
+    prompt = _ANALYZE_UNRELEASED_PROMPT.format(module_name=module_name, entries=bullets)
 
-Module: {module_name}
+    cached = _read_cached_analysis(prompt)
+    if cached is not None:
+        log_func("→ Using cached analysis for identical entries", to_console=True)
+        return cached
 
-Unreleased entries:
-{bullets}
+    analysis = await _query_json_with_retries(prompt, pool, log_func, "Claude analysis failed")
 
-Version Bump Rules (Semantic Versioning):
-
-**MAJOR** - Breaking changes that require user action:
-- Removed/renamed public APIs, functions, or CLI flags
-- Changed behavior that breaks existing usage
-- Incompatible configuration changes
-
-**MINOR** - New functionality (backwards-compatible):
-- New features, commands, endpoints, or modes
-- New CLI flags or configuration options
-- New public APIs or functions
-- Significant capability additions
-- Keywords: "add", "new", "support", "implement", "introduce"
-
-**PATCH** - Bug fixes and maintenance:
-- Bug fixes
-- Documentation updates (README, comments)
-- Dependency updates (unless they add features)
-- CI/CD changes, workflow updates
-- Performance improvements (no new features)
-- Refactoring (no behavior change)
-
-IMPORTANT: Lean toward MINOR if any entry adds NEW functionality, even if mixed with patches.
-Example: "Add REST server mode" + "Update README" = MINOR (new feature present)
-
-Return ONLY this JSON format (no markdown, no code blocks):
-{{
-  "version_bump": "patch|minor|major"
-}}"""
-
-    max_retries = 3
-    retry_delays = [2, 5, 10]
-
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            clean_config_dir = _get_clean_config_dir()
-            env = os.environ.copy()
-            if clean_config_dir is not None:
-                env["CLAUDE_CONFIG_DIR"] = str(clean_config_dir)
-
-            options = ClaudeCodeOptions(
-                model=config.MODEL,
-                env=env,
-            )
-
-            response_text = ""
-
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                response_text += block.text
-
-            # Parse JSON response
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            else:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end].strip()
-
-            try:
-                analysis = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                raise ClaudeError(
-                    f"Failed to parse Claude response as JSON: {e}\nResponse: {response_text}"
-                ) from e
-
-            version_bump = analysis.get("version_bump", "patch")
-            return {
-                "version_bump": version_bump,
-            }
-
-        except Exception as e:
-            error_str = str(e).lower()
-            is_retryable = any(
-                keyword in error_str
-                for keyword in ["timeout", "control request", "connection", "initialize"]
-            )
-
-            if is_retryable and attempt < max_retries - 1:
-                delay = retry_delays[attempt]
-                log_func(
-                    f"→ Timeout error (attempt {attempt + 1}/{max_retries}), "
-                    f"retrying in {delay}s...",
-                    to_console=True,
-                )
-                await asyncio.sleep(delay)
-                last_error = e
-                continue
-            else:
-                raise ClaudeError(f"Claude analysis failed: {e}") from e
-
-        finally:
-            await asyncio.sleep(config.CLAUDE_SESSION_DELAY)
-
-    raise ClaudeError(f"Claude analysis failed after {max_retries} attempts") from last_error
+    version_bump = analysis.get("version_bump", "patch")
+    result = {
+        "version_bump": version_bump,
+    }
+    _write_cached_analysis(prompt, result)
+    return result
 
 
 async def generate_changelog_from_commits(
-    commits: list[dict[str, str]], module_name: str, log_func: Callable[..., None] = log_message
+    commits: list[dict[str, str]],
+    module_name: str,
+    log_func: Callable[..., None] = log_message,
+    pool: ClaudePool | None = None,
 ) -> list[str]:
     """Generate changelog entries from git commits using Claude.
 
@@ -491,6 +745,7 @@ async def generate_changelog_from_commits(
         commits: List of dicts with 'hash', 'subject', 'body' keys
         module_name: Name of the module
         log_func: Logging function to use
+        pool: Shared Claude session to use instead of a fresh one
 
     Returns:
         List of changelog entry strings (without leading "- ")
@@ -505,104 +760,10 @@ async def generate_changelog_from_commits(
         f"- {c['subject']}" + (f"\n  {c['body']}" if c["body"] else "") for c in commits
     )
 
-    prompt = f"""Generate CHANGELOG entries from these git commits.
-
-Module: {module_name}
-
-Commits since last release:
-{commit_text}
-
-Rules:
-- Create clear, user-facing changelog entries
-- Group related commits into single entries when appropriate
-- Use past tense (e.g., "Added", "Fixed", "Updated")
-- Focus on WHAT changed, not HOW
-- Omit merge commits and trivial changes (typos, formatting)
-- Each entry should be a complete sentence fragment
-
-Return ONLY this JSON format (no markdown, no code blocks):
-{{
-  "entries": [
-    "Add REST server mode for HTTP clients",
-    "Fix race condition in connection pool",
-    "Update Go to 1.26.0"
-  ]
-}}"""
-
-    max_retries = 3
-    retry_delays = [2, 5, 10]
-
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            clean_config_dir = _get_clean_config_dir()
-            env = os.environ.copy()
-            if clean_config_dir is not None:
-                env["CLAUDE_CONFIG_DIR"] = str(clean_config_dir)
+    prompt = _CHANGELOG_FROM_COMMITS_PROMPT.format(module_name=module_name, commits=commit_text)
 
-            options = ClaudeCodeOptions(
-                model=config.MODEL,
-                env=env,
-            )
-
-            response_text = ""
-
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                response_text += block.text
-
-            # Parse JSON response
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            else:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end].strip()
-
-            try:
-                analysis = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                raise ClaudeError(
-                    f"Failed to parse Claude response as JSON: {e}\nResponse: {response_text}"
-                ) from e
-
-            entries = analysis.get("entries", [])
-            log_func(f"  Generated {len(entries)} changelog entries", to_console=True)
-            return entries
-
-        except Exception as e:
-            error_str = str(e).lower()
-            is_retryable = any(
-                keyword in error_str
-                for keyword in ["timeout", "control request", "connection", "initialize"]
-            )
-
-            if is_retryable and attempt < max_retries - 1:
-                delay = retry_delays[attempt]
-                log_func(
-                    f"→ Timeout error (attempt {attempt + 1}/{max_retries}), "
-                    f"retrying in {delay}s...",
-                    to_console=True,
-                )
-                await asyncio.sleep(delay)
-                last_error = e
-                continue
-            else:
-                raise ClaudeError(f"Changelog generation failed: {e}") from e
-
-        finally:
-            await asyncio.sleep(config.CLAUDE_SESSION_DELAY)
+    analysis = await _query_json_with_retries(prompt, pool, log_func, "Changelog generation failed")
 
-    raise ClaudeError(f"Changelog generation failed after {max_retries} attempts") from last_error
+    entries = analysis.get("entries", [])
+    log_func(f"  Generated {len(entries)} changelog entries", to_console=True)
+    return entries
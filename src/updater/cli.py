@@ -1,36 +1,63 @@
 """CLI orchestration and workflow."""
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import contextlib
+import os
+import sys
 import traceback
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import config
-from .claude_analyzer import verify_claude_auth
+from .claude_analyzer import shared_claude_session, verify_claude_auth
 from .docker_updater import update_dockerfile_images
 from .file_utils import condense_file_list
 from .git_operations import (
-    check_git_status,
+    check_git_status_many_async,
     ensure_gitignore_entry,
     find_git_repo,
     update_git_branch,
 )
 from .log_manager import (
+    buffered_console,
     cleanup_old_logs,
     close_module_logging,
     log_message,
     setup_module_logging,
+    write_console,
 )
 from .module_discovery import (
     discover_all_modules,
-    discover_go_modules,
-    discover_legacy_python_projects,
-    discover_python_modules,
+    discover_dockerfile_dirs,
+    marker_files,
 )
-from .prompts import prompt_skip_or_retry, prompt_yes_no
+from .prompts import ask, prompt_skip_or_retry, prompt_yes_no
 from .sound import play_completion_sound, play_error_sound
 
+if TYPE_CHECKING:
+    from .pipeline import Step
+
+# Summary sections of the update workflow as (status, label) pairs
+_UPDATE_SUMMARY_SECTIONS = [
+    ("updated", "✓ Updated"),
+    ("up-to-date", "✓ Already up to date"),
+    ("skipped", "⚠ Skipped"),
+    ("failed", "✗ Failed"),
+]
+
+# Summary sections of the release workflow as (status, label) pairs
+_RELEASE_SUMMARY_SECTIONS = [
+    ("released", "✓ Released"),
+    ("nothing-to-release", "✓ Nothing to release"),
+    ("skipped", "⚠ Skipped"),
+    ("failed", "✗ Failed"),
+]
+
 
 def print_commit_summary(
     module_name: str,
@@ -46,51 +73,67 @@ def print_commit_summary(
         new_version: Optional version string (for versioned commits)
         note: Optional note to display (e.g., "No CHANGELOG.md found")
     """
-    print("\n" + "=" * 60)
-    print(f"READY TO COMMIT: {module_name}")
-    print("=" * 60)
+    lines = ["", "=" * 60, f"READY TO COMMIT: {module_name}", "=" * 60]
     if new_version:
-        print(f"Version:        {new_version} ({analysis['version_bump']} bump)")
-    print(f"Commit message: {analysis['commit_message']}")
+        lines.append(f"Version:        {new_version} ({analysis['version_bump']} bump)")
+    lines.append(f"Commit message: {analysis['commit_message']}")
     if new_version:
-        print(f"Git tag:        {new_version} (will be created)")
-        print("\nChangelog entries:")
+        lines.append(f"Git tag:        {new_version} (will be created)")
+        lines.append("\nChangelog entries:")
     else:
-        print("\nChanges:")
-    for bullet in analysis["changelog"]:
-        print(f"  - {bullet.lstrip('- ')}")
+        lines.append("\nChanges:")
+    lines.extend(f"  - {bullet.removeprefix('- ')}" for bullet in analysis["changelog"])
     if note:
-        print(f"\nNote: {note}")
-    print("=" * 60)
+        lines.append(f"\nNote: {note}")
+    lines.append("=" * 60)
 
+    # One write, so the summary isn't interleaved with output of concurrent modules
+    write_console("\n".join(lines) + "\n")
 
-async def process_single_go_module(module_path: Path, update_deps: bool = True) -> tuple[bool, str]:
-    """Process a single Go module.
 
-    Creates a new Claude session for analyzing changes to ensure clean, isolated analysis.
-    Delegates to a composable pipeline of steps.
+def print_summary(
+    header: str, results: list[tuple[Path, str]], sections: list[tuple[str, str]]
+) -> None:
+    """Print a run summary listing the modules of each non-empty section.
+
+    Args:
+        header: Summary title line
+        results: (module, status) pairs in processing order
+        sections: (status, label) pairs, e.g. ("updated", "✓ Updated")
+    """
+    # Bucket the results in one pass instead of one scan per section
+    buckets: dict[str, list[Path]] = {status: [] for status, _ in sections}
+    for mod, status in results:
+        if status in buckets:
+            buckets[status].append(mod)
+
+    lines = ["", "=" * 70, header, "=" * 70]
+    for status, label in sections:
+        mods = buckets[status]
+        if mods:
+            lines.append(f"\n{label}: {len(mods)}")
+            lines.extend(f"  - {mod.name}" for mod in mods)
+    lines.append("\n" + "=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+async def _run_module_pipeline(
+    module_path: Path, module_label: str, steps: list[Step]
+) -> tuple[bool, str]:
+    """Run a module's update pipeline with per-module logging.
 
     Args:
         module_path: Path to the module
-        update_deps: Whether to update dependencies (default: True)
+        module_label: Module name shown in the header
+        steps: Pipeline steps to run
 
     Returns:
         Tuple of (success: bool, status: str)
         status can be: 'updated', 'up-to-date', 'skipped', 'failed'
     """
-    from .pipeline import (
-        ChangelogStep,
-        CheckChangesStep,
-        GitCommitStep,
-        GitConfirmStep,
-        GoDepSkipStep,
-        GoDepUpdateStep,
-        GoExcludesStep,
-        GoVersionUpdateStep,
-        Pipeline,
-        PrecommitStep,
-        StepStatus,
-    )
+    from .pipeline import Pipeline, StepStatus
 
     log_file = None
     try:
@@ -98,10 +141,10 @@ async def process_single_go_module(module_path: Path, update_deps: bool = True)
         log_file = setup_module_logging(module_path)
 
         log_message(f"\n{'=' * 70}", to_console=True)
-        log_message(f"Module: {module_path.name}", to_console=True)
+        log_message(f"Module: {module_label}", to_console=True)
         log_message("=" * 70, to_console=True)
         if log_file and not config.VERBOSE_MODE:
-            print(f"  Log: {log_file}")
+            write_console(f"  Log: {log_file}\n")
 
         # Ensure .update-logs/ is in .gitignore
         ensure_gitignore_entry(module_path, log_func=log_message)
@@ -112,23 +155,7 @@ async def process_single_go_module(module_path: Path, update_deps: bool = True)
             log_message("✗ No git repository found", to_console=True)
             return (False, "failed")
 
-        # Build pipeline
-        dep_step = GoDepUpdateStep() if update_deps else GoDepSkipStep()
-        pipeline = Pipeline(
-            [
-                GoVersionUpdateStep(),
-                GoExcludesStep(),
-                dep_step,
-                CheckChangesStep(phase="update"),
-                PrecommitStep(project_type="go"),
-                CheckChangesStep(phase="precommit"),
-                ChangelogStep(),
-                GitConfirmStep(),
-                GitCommitStep(),
-            ]
-        )
-
-        result = await pipeline.run(module_path)
+        result = await Pipeline(steps).run(module_path)
 
         if result.status == StepStatus.UP_TO_DATE:
             return (True, "up-to-date")
@@ -147,14 +174,15 @@ async def process_single_go_module(module_path: Path, update_deps: bool = True)
         cleanup_old_logs(module_path)
 
 
-async def process_single_python_module(module_path: Path) -> tuple[bool, str]:
-    """Process a single Python module.
+async def process_single_go_module(module_path: Path, update_deps: bool = True) -> tuple[bool, str]:
+    """Process a single Go module.
 
     Creates a new Claude session for analyzing changes to ensure clean, isolated analysis.
     Delegates to a composable pipeline of steps.
 
     Args:
         module_path: Path to the module
+        update_deps: Whether to update dependencies (default: True)
 
     Returns:
         Tuple of (success: bool, status: str)
@@ -165,63 +193,68 @@ async def process_single_python_module(module_path: Path) -> tuple[bool, str]:
         CheckChangesStep,
         GitCommitStep,
         GitConfirmStep,
-        Pipeline,
+        GoDepSkipStep,
+        GoDepUpdateStep,
+        GoExcludesStep,
+        GoVersionUpdateStep,
         PrecommitStep,
-        PythonDepUpdateStep,
-        PythonVersionUpdateStep,
-        StepStatus,
     )
 
-    log_file = None
-    try:
-        # Setup logging for this module
-        log_file = setup_module_logging(module_path)
-
-        log_message(f"\n{'=' * 70}", to_console=True)
-        log_message(f"Module: {module_path.name} (Python)", to_console=True)
-        log_message("=" * 70, to_console=True)
-        if log_file and not config.VERBOSE_MODE:
-            print(f"  Log: {log_file}")
+    dep_step = GoDepUpdateStep() if update_deps else GoDepSkipStep()
+    return await _run_module_pipeline(
+        module_path,
+        module_path.name,
+        [
+            GoVersionUpdateStep(),
+            GoExcludesStep(),
+            dep_step,
+            CheckChangesStep(phase="update"),
+            PrecommitStep(project_type="go"),
+            CheckChangesStep(phase="precommit"),
+            ChangelogStep(),
+            GitConfirmStep(),
+            GitCommitStep(),
+        ],
+    )
 
-        # Ensure .update-logs/ is in .gitignore
-        ensure_gitignore_entry(module_path, log_func=log_message)
 
-        # Find git repo first
-        git_repo = find_git_repo(module_path)
-        if not git_repo:
-            log_message("✗ No git repository found", to_console=True)
-            return (False, "failed")
+async def process_single_python_module(module_path: Path) -> tuple[bool, str]:
+    """Process a single Python module.
 
-        # Build pipeline
-        pipeline = Pipeline(
-            [
-                PythonVersionUpdateStep(),
-                PythonDepUpdateStep(),
-                CheckChangesStep(phase="update"),
-                PrecommitStep(project_type="python"),
-                CheckChangesStep(phase="precommit"),
-                ChangelogStep(),
-                GitConfirmStep(),
-                GitCommitStep(),
-            ]
-        )
+    Creates a new Claude session for analyzing changes to ensure clean, isolated analysis.
+    Delegates to a composable pipeline of steps.
 
-        result = await pipeline.run(module_path)
+    Args:
+        module_path: Path to the module
 
-        if result.status == StepStatus.UP_TO_DATE:
-            return (True, "up-to-date")
-        if result.status == StepStatus.SKIP:
-            return (True, "skipped")
-        return (True, "updated")
+    Returns:
+        Tuple of (success: bool, status: str)
+        status can be: 'updated', 'up-to-date', 'skipped', 'failed'
+    """
+    from .pipeline import (
+        ChangelogStep,
+        CheckChangesStep,
+        GitCommitStep,
+        GitConfirmStep,
+        PrecommitStep,
+        PythonDepUpdateStep,
+        PythonVersionUpdateStep,
+    )
 
-    except Exception as e:
-        log_message(f"\n✗ Error processing {module_path}: {e}", to_console=True)
-        if config.VERBOSE_MODE:
-            traceback.print_exc()
-        return (False, "failed")
-    finally:
-        close_module_logging()
-        cleanup_old_logs(module_path)
+    return await _run_module_pipeline(
+        module_path,
+        f"{module_path.name} (Python)",
+        [
+            PythonVersionUpdateStep(),
+            PythonDepUpdateStep(),
+            CheckChangesStep(phase="update"),
+            PrecommitStep(project_type="python"),
+            CheckChangesStep(phase="precommit"),
+            ChangelogStep(),
+            GitConfirmStep(),
+            GitCommitStep(),
+        ],
+    )
 
 
 async def process_module_with_retry(
@@ -242,7 +275,7 @@ async def process_module_with_retry(
 
     while True:
         if attempt > 1:
-            print(f"\n=== Retrying {module_path} (attempt {attempt}) ===\n")
+            write_console(f"\n=== Retrying {module_path} (attempt {attempt}) ===\n\n")
 
         if project_type == "python":
             success, status = await process_single_python_module(module_path)
@@ -270,34 +303,185 @@ async def process_module_with_retry(
 
         # Failed - prompt for skip or retry
         play_error_sound()
-        print(f"\n✗ Module {module_path} failed")
-        print("  → Fix the issues and retry, or skip this module")
+        write_console(f"\n✗ Module {module_path} failed\n")
+        write_console("  → Fix the issues and retry, or skip this module\n")
 
-        choice = prompt_skip_or_retry()
+        choice = await ask(prompt_skip_or_retry)
 
         if choice == "skip":
-            print(f"⚠ Skipping {module_path}\n")
+            write_console(f"⚠ Skipping {module_path}\n\n")
             return False, "skipped"
 
         # Retry - increment attempt counter
         attempt += 1
 
 
-async def main_async() -> int:
-    """Main async workflow with auto-detection of project types.
+async def run_grouped_by_repo(
+    modules: list[Path],
+    jobs: int,
+    process: Callable[[int, Path], Awaitable[tuple[bool, str]]],
+    stop_on_failure: bool = False,
+) -> list[tuple[Path, bool, str]]:
+    """Run `process` for each module, up to `jobs` git repositories at a time.
+
+    Modules sharing a git repository are processed one after another in the
+    given order, since they commit and tag in the same working tree. With
+    jobs=1 all modules run one after another in the given order.
+
+    Args:
+        modules: Module paths in processing order
+        jobs: Maximum number of git repositories processed concurrently
+        process: Coroutine function called with (1-based index, module path)
+        stop_on_failure: Start no further modules once one has failed
 
     Returns:
-        Exit code (0 for success, 1 for error)
+        (module, success, status) tuples for the processed modules, in the
+        order of `modules`
     """
-    parser = argparse.ArgumentParser(
-        description="Update dependencies for Go and Python projects (auto-detect)"
-    )
-    parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to module(s) or parent directories (default: current directory)",
-    )
+    groups: list[list[tuple[int, Path]]]
+    if jobs > 1:
+        by_repo: dict[Path, list[tuple[int, Path]]] = {}
+        for i, mod in enumerate(modules, 1):
+            repo = find_git_repo(mod) or mod
+            by_repo.setdefault(repo, []).append((i, mod))
+        groups = list(by_repo.values())
+    else:
+        # A serial run keeps the given order, even across repositories
+        groups = [list(enumerate(modules, 1))]
+
+    semaphore = asyncio.Semaphore(jobs)
+    results: dict[int, tuple[Path, bool, str]] = {}
+    failed = False
+
+    async def process_repo(repo_modules: list[tuple[int, Path]]) -> None:
+        nonlocal failed
+        async with semaphore:
+            for i, mod in repo_modules:
+                if failed and stop_on_failure:
+                    return
+                # With several repositories in flight, print each module's output as one block
+                with buffered_console() if jobs > 1 else contextlib.nullcontext():
+                    try:
+                        success, status = await process(i, mod)
+                    except Exception as e:
+                        # Fail this module only; don't cancel other repositories mid-commit
+                        write_console(f"\n✗ Error processing {mod}: {e}\n")
+                        success, status = False, "failed"
+                results[i] = (mod, success, status)
+                failed = failed or not success
+
+    async with asyncio.TaskGroup() as tg:
+        for repo_modules in groups:
+            tg.create_task(process_repo(repo_modules))
+
+    return [results[i] for i in sorted(results)]
+
+
+async def process_modules_concurrently(
+    modules: list[tuple[Path, str]], jobs: int
+) -> list[tuple[Path, bool, str, str]]:
+    """Process modules of any project type, up to `jobs` git repositories at a time.
+
+    Args:
+        modules: (module path, project type) pairs in processing order
+        jobs: Maximum number of git repositories processed concurrently
+
+    Returns:
+        (module, success, status, project_type) tuples in the order of `modules`
+    """
+    project_types = dict(modules)
+
+    async def process(i: int, mod: Path) -> tuple[bool, str]:
+        project_type = project_types[mod]
+        lang = {"go": "Go", "python": "Python"}.get(project_type, "Docker")
+        write_console(
+            f"\n{'#' * 70}\n[{i}/{len(modules)}] Processing {mod.name} ({lang})\n{'#' * 70}\n"
+        )
+        return await process_module_with_retry(mod, project_type=project_type)
+
+    results = await run_grouped_by_repo([mod for mod, _ in modules], jobs, process)
+    return [(mod, success, status, project_types[mod]) for mod, success, status in results]
+
+
+async def _process_until_failure(
+    modules: list[Path], jobs: int, project_type: str, update_deps: bool = True
+) -> bool:
+    """Process modules of one type, starting no new ones after a module fails.
+
+    Args:
+        modules: Module paths in processing order
+        jobs: Maximum number of git repositories processed concurrently
+        project_type: Type of project ("go" or "python")
+        update_deps: Whether to update dependencies for Go modules
+
+    Returns:
+        True if every module succeeded
+    """
+
+    async def process(i: int, mod: Path) -> tuple[bool, str]:
+        if len(modules) > 1:
+            write_console(f"\n[{i}/{len(modules)}] {mod.name}\n")
+        return await process_module_with_retry(
+            mod, project_type=project_type, update_deps=update_deps
+        )
+
+    results = await run_grouped_by_repo(modules, jobs, process, stop_on_failure=True)
+    return all(success for _, success, _ in results)
+
+
+async def update_git_repositories(repos: list[Path]) -> list[Path]:
+    """Fetch and update git repositories concurrently.
+
+    Each repository's progress is buffered and printed in the given order once
+    all updates have finished, so the output doesn't interleave.
+
+    Args:
+        repos: Repository roots to update
+
+    Returns:
+        Repositories that failed to update
+    """
+    semaphore = asyncio.Semaphore(max(1, min(8, len(repos))))
+
+    async def update(repo: Path) -> tuple[bool, list[str]]:
+        lines: list[str] = []
+
+        def log(msg: str, to_console: bool = True) -> None:
+            lines.append(msg)
+
+        async with semaphore:
+            success = await asyncio.to_thread(update_git_branch, repo, log)
+        return success, lines
+
+    outcomes = await asyncio.gather(*(update(repo) for repo in repos))
+
+    failed = []
+    for repo, (success, lines) in zip(repos, outcomes, strict=True):
+        print(f"→ {repo.name}")
+        for line in lines:
+            print(line)
+        if not success:
+            failed.append(repo)
+    return failed
+
+
+def _build_parser(
+    description: str,
+    modules_help: str,
+    confirm_help: str = "Require user confirmation before committing (default: auto-commit)",
+) -> argparse.ArgumentParser:
+    """Build an argument parser with the options shared by the update commands.
+
+    Args:
+        description: Parser description
+        modules_help: Help text for the positional module paths
+        confirm_help: Help text for --require-commit-confirm
+
+    Returns:
+        Parser with modules, --verbose, --model, --require-commit-confirm and --jobs
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("modules", nargs="*", default=["."], help=modules_help)
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -309,10 +493,65 @@ async def main_async() -> int:
         default="sonnet",
         help="Claude model to use (default: sonnet)",
     )
+    parser.add_argument("--require-commit-confirm", action="store_true", help=confirm_help)
     parser.add_argument(
-        "--require-commit-confirm",
-        action="store_true",
-        help="Require user confirmation before committing (default: auto-commit)",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Process up to N git repositories concurrently (default: 1)",
+    )
+    return parser
+
+
+def _apply_common_args(args: argparse.Namespace) -> None:
+    """Set global config from the options added by _build_parser."""
+    config.VERBOSE_MODE = args.verbose
+    config.MODEL = args.model
+    config.REQUIRE_CONFIRM = args.require_commit_confirm
+    config.MAX_PARALLEL = max(1, args.jobs)
+    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+
+
+def _resolve_paths(path_strs: list[str]) -> list[Path] | None:
+    """Resolve path arguments, printing an error and returning None if one is unusable."""
+    paths = []
+    for path_str in path_strs:
+        try:
+            paths.append(Path(path_str).resolve(strict=True))
+        except OSError, RuntimeError:
+            # Missing, below a regular file, or a symlink loop
+            print(f"✗ Path does not exist: {Path(path_str).absolute()}")
+            return None
+    return paths
+
+
+async def _discover_recursive(paths: list[Path]) -> dict[Path, dict[str, list[Path]]]:
+    """Search several directories for modules in parallel worker threads.
+
+    The walks are independent filesystem traversals, so they overlap well.
+
+    Args:
+        paths: Directories to search recursively
+
+    Returns:
+        discover_all_modules() result for each path
+    """
+    found = await asyncio.gather(
+        *(asyncio.to_thread(discover_all_modules, path, True) for path in paths)
+    )
+    return dict(zip(paths, found, strict=True))
+
+
+async def main_async() -> int:
+    """Main async workflow with auto-detection of project types.
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = _build_parser(
+        "Update dependencies for Go and Python projects (auto-detect)",
+        "Path(s) to module(s) or parent directories (default: current directory)",
     )
     parser.add_argument(
         "--skip-git-update",
@@ -324,15 +563,23 @@ async def main_async() -> int:
         action="store_true",
         help="Add changes to ## Unreleased instead of creating version/tag (useful for PRs)",
     )
+    parser.add_argument(
+        "--claude-cache",
+        action="store_true",
+        help="Reuse cached Claude analyses for unchanged diffs (~/.cache/updater/claude)",
+    )
+    parser.add_argument(
+        "--reuse-claude-session",
+        action="store_true",
+        help="Analyze all modules over one Claude connection (faster, each query keeps its own context)",
+    )
 
     args = parser.parse_args()
 
     # Set global state
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
+    _apply_common_args(args)
     config.NO_TAG = args.no_tag
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+    config.CLAUDE_CACHE_ENABLED = args.claude_cache
 
     # Step 0: Verify Claude authentication
     print("=== Step 0: Verify Claude Authentication ===\n")
@@ -347,14 +594,10 @@ async def main_async() -> int:
     print("=== Step 1: Discover Modules ===\n")
 
     # Resolve and validate all module paths
-    module_paths = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Module path does not exist: {path}")
-            play_completion_sound()
-            return 1
-        module_paths.append(path)
+    module_paths = _resolve_paths(args.modules)
+    if module_paths is None:
+        play_completion_sound()
+        return 1
 
     # Discover modules from each provided path
     go_modules: list[Path] = []
@@ -362,18 +605,31 @@ async def main_async() -> int:
     docker_projects: list[Path] = []
     legacy_projects: list[Path] = []
 
+    # Check which paths are single modules; the rest are searched recursively
+    roots: list[tuple[Path, str | None]] = []
     for module_path in module_paths:
-        # Check if this is a single module
-        if (module_path / "go.mod").exists():
+        names = marker_files(module_path)
+        if "go.mod" in names:
+            roots.append((module_path, "go"))
+        elif {"pyproject.toml", "uv.lock"} <= names:
+            roots.append((module_path, "python"))
+        elif "Dockerfile" in names:
+            # Standalone Dockerfile (not in Go/Python project)
+            roots.append((module_path, "docker"))
+        else:
+            roots.append((module_path, None))
+
+    searched = await _discover_recursive([path for path, kind in roots if kind is None])
+
+    for module_path, kind in roots:
+        if kind == "go":
             go_modules.append(module_path)
-        elif (module_path / "pyproject.toml").exists() and (module_path / "uv.lock").exists():
+        elif kind == "python":
             python_modules.append(module_path)
-        elif (module_path / "Dockerfile").exists():
-            # Standalone Dockerfile (not in Go/Python project)
+        elif kind == "docker":
             docker_projects.append(module_path)
         else:
-            # Search recursively
-            discovered = discover_all_modules(module_path, recursive=True)
+            discovered = searched[module_path]
             go_modules.extend(discovered["go"])
             python_modules.extend(discovered["python"])
             docker_projects.extend(discovered["docker"])
@@ -437,12 +693,7 @@ async def main_async() -> int:
         print("=== Step 2: Update Git Repositories ===\n")
         print(f"Updating {len(module_repos)} unique git repository(ies)\n")
 
-        update_errors = []
-
-        for repo in sorted(module_repos):
-            print(f"→ {repo.name}")
-            if not update_git_branch(repo):
-                update_errors.append(repo)
+        update_errors = await update_git_repositories(sorted(module_repos))
 
         print()
 
@@ -459,9 +710,10 @@ async def main_async() -> int:
 
     dirty_modules = []
 
-    for module, project_type in all_modules:
-        change_count, files = check_git_status(module)
+    # One git status per repository, shared by the modules inside it
+    statuses = await check_git_status_many_async([module for module, _ in all_modules])
 
+    for (module, project_type), (change_count, files) in zip(all_modules, statuses, strict=True):
         if change_count == -1:
             print(f"✗ Failed to check status: {module.name}")
             play_completion_sound()
@@ -475,13 +727,13 @@ async def main_async() -> int:
         for module, count, files, _ in dirty_modules:
             print(f"  - {module.name}: {count} file(s)")
 
-            condensed_files = condense_file_list(files)
-            if len(condensed_files) <= 20:
+            condensed_files = condense_file_list(files, limit=20)
+            if condensed_files is not None:
                 for f in condensed_files:
                     print(f"      {f}")
             print()
 
-        if not prompt_yes_no("Continue anyway?", default_yes=True):
+        if not await ask(prompt_yes_no, "Continue anyway?", default_yes=True):
             print("\n✗ Aborted by user")
             play_completion_sound()
             return 1
@@ -508,15 +760,10 @@ async def main_async() -> int:
     else:
         print(f"=== Processing {total_modules} Modules ===\n")
 
-        results = []
-        for i, (mod, project_type) in enumerate(all_modules, 1):
-            lang = "Go" if project_type == "go" else "Python"
-            print(f"\n{'#' * 70}")
-            print(f"[{i}/{total_modules}] Processing {mod.name} ({lang})")
-            print("#" * 70)
-
-            success, status = await process_module_with_retry(mod, project_type=project_type)
-            results.append((mod, success, status, project_type))
+        async with contextlib.AsyncExitStack() as stack:
+            if args.reuse_claude_session:
+                await stack.enter_async_context(shared_claude_session())
+            results = await process_modules_concurrently(all_modules, config.MAX_PARALLEL)
 
         # Summary
         # Find common base path for all modules
@@ -526,48 +773,17 @@ async def main_async() -> int:
             if len(module_paths_list) == 1:
                 common_path = module_paths_list[0].parent
             else:
-                # Find common parent directory
-                common_path = module_paths_list[0]
-                for mod_path in module_paths_list[1:]:
-                    # Find common ancestor
-                    while common_path not in mod_path.parents and common_path != mod_path:
-                        common_path = common_path.parent
-                        if common_path == common_path.parent:  # Reached root
-                            break
-
-        print("\n" + "=" * 70)
+                common_path = Path(os.path.commonpath(module_paths_list))
+
         if common_path:
-            print(f"SUMMARY: {total_modules} module(s) in {common_path}")
+            header = f"SUMMARY: {total_modules} module(s) in {common_path}"
         else:
-            print(f"SUMMARY: {total_modules} module(s)")
-        print("=" * 70)
-
-        updated = [mod for mod, _, status, _ in results if status == "updated"]
-        up_to_date = [mod for mod, _, status, _ in results if status == "up-to-date"]
-        skipped = [mod for mod, _, status, _ in results if status == "skipped"]
-        failed = [mod for mod, _, status, _ in results if status == "failed"]
-
-        if updated:
-            print(f"\n✓ Updated: {len(updated)}")
-            for mod in updated:
-                print(f"  - {mod.name}")
-
-        if up_to_date:
-            print(f"\n✓ Already up to date: {len(up_to_date)}")
-            for mod in up_to_date:
-                print(f"  - {mod.name}")
-
-        if skipped:
-            print(f"\n⚠ Skipped: {len(skipped)}")
-            for mod in skipped:
-                print(f"  - {mod.name}")
-
-        if failed:
-            print(f"\n✗ Failed: {len(failed)}")
-            for mod in failed:
-                print(f"  - {mod.name}")
-
-        print("\n" + "=" * 70)
+            header = f"SUMMARY: {total_modules} module(s)"
+        print_summary(
+            header,
+            [(mod, status) for mod, _, status, _ in results],
+            _UPDATE_SUMMARY_SECTIONS,
+        )
 
         play_completion_sound()
         return 0
@@ -585,54 +801,39 @@ def main() -> int:
 # --- Explicit entry points ---
 
 
-async def main_go_async() -> int:
-    """Go-only async workflow."""
-    parser = argparse.ArgumentParser(
-        description="Update Go module dependencies, CHANGELOG, and create git tags"
-    )
-    parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to Go module(s) or parent directories (default: current directory)",
-    )
-    parser.add_argument("--verbose", action="store_true", help="Show full command output")
-    parser.add_argument(
-        "--model",
-        choices=["sonnet", "opus", "haiku"],
-        default="sonnet",
-        help="Claude model to use (default: sonnet)",
-    )
-    parser.add_argument(
-        "--require-commit-confirm",
-        action="store_true",
-        help="Require user confirmation before committing",
-    )
+async def _main_go_workflow(description: str, update_deps: bool) -> int:
+    """Shared Go-only workflow behind the update-go* commands.
+
+    Args:
+        description: Parser description of the command
+        update_deps: Whether to update dependencies
 
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = _build_parser(
+        description,
+        "Path(s) to Go module(s) or parent directories (default: current directory)",
+    )
     args = parser.parse_args()
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+    _apply_common_args(args)
 
     # Discover Go modules only
     print("=== Discover Go Modules ===\n")
 
-    module_paths = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Path does not exist: {path}")
-            return 1
-        module_paths.append(path)
+    module_paths = _resolve_paths(args.modules)
+    if module_paths is None:
+        return 1
+
+    is_module = {path: "go.mod" in marker_files(path) for path in module_paths}
+    searched = await _discover_recursive([path for path in module_paths if not is_module[path]])
 
     modules = []
     for module_path in module_paths:
-        if (module_path / "go.mod").exists():
+        if is_module[module_path]:
             modules.append(module_path)
         else:
-            discovered = discover_go_modules(module_path, recursive=True)
-            modules.extend(discovered)
+            modules.extend(searched[module_path]["go"])
 
     if not modules:
         print("✗ No Go modules found")
@@ -643,18 +844,22 @@ async def main_go_async() -> int:
 
     print(f"Found {len(modules)} Go module(s)\n")
 
-    # Process each module
-    for i, mod in enumerate(modules, 1):
-        if len(modules) > 1:
-            print(f"\n[{i}/{len(modules)}] {mod.name}")
-        success, _ = await process_module_with_retry(mod, project_type="go")
-        if not success:
-            return 1
+    if not await _process_until_failure(
+        modules, config.MAX_PARALLEL, "go", update_deps=update_deps
+    ):
+        return 1
 
     play_completion_sound()
     return 0
 
 
+async def main_go_async() -> int:
+    """Go-only async workflow."""
+    return await _main_go_workflow(
+        "Update Go module dependencies, CHANGELOG, and create git tags", update_deps=True
+    )
+
+
 def main_go() -> int:
     """Go-only entry point (includes dependency updates)."""
     return asyncio.run(main_go_async())
@@ -662,70 +867,9 @@ def main_go() -> int:
 
 async def main_go_only_async() -> int:
     """Go version-only async workflow (no dependency updates)."""
-    parser = argparse.ArgumentParser(description="Update Go versions only (no dependency updates)")
-    parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to Go module(s) or parent directories (default: current directory)",
+    return await _main_go_workflow(
+        "Update Go versions only (no dependency updates)", update_deps=False
     )
-    parser.add_argument("--verbose", action="store_true", help="Show full command output")
-    parser.add_argument(
-        "--model",
-        choices=["sonnet", "opus", "haiku"],
-        default="sonnet",
-        help="Claude model to use (default: sonnet)",
-    )
-    parser.add_argument(
-        "--require-commit-confirm",
-        action="store_true",
-        help="Require user confirmation before committing",
-    )
-
-    args = parser.parse_args()
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-
-    # Discover Go modules only
-    print("=== Discover Go Modules ===\n")
-
-    module_paths = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Path does not exist: {path}")
-            return 1
-        module_paths.append(path)
-
-    modules = []
-    for module_path in module_paths:
-        if (module_path / "go.mod").exists():
-            modules.append(module_path)
-        else:
-            discovered = discover_go_modules(module_path, recursive=True)
-            modules.extend(discovered)
-
-    if not modules:
-        print("✗ No Go modules found")
-        return 1
-
-    # Remove duplicates
-    modules = list(dict.fromkeys(modules))
-
-    print(f"Found {len(modules)} Go module(s)\n")
-
-    # Process each module (version updates only)
-    for i, mod in enumerate(modules, 1):
-        if len(modules) > 1:
-            print(f"\n[{i}/{len(modules)}] {mod.name}")
-        success, _ = await process_module_with_retry(mod, project_type="go", update_deps=False)
-        if not success:
-            return 1
-
-    play_completion_sound()
-    return 0
 
 
 def main_go_only() -> int:
@@ -735,70 +879,7 @@ def main_go_only() -> int:
 
 async def main_go_with_deps_async() -> int:
     """Go with dependencies async workflow (explicit name for clarity)."""
-    parser = argparse.ArgumentParser(description="Update Go versions and dependencies")
-    parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to Go module(s) or parent directories (default: current directory)",
-    )
-    parser.add_argument("--verbose", action="store_true", help="Show full command output")
-    parser.add_argument(
-        "--model",
-        choices=["sonnet", "opus", "haiku"],
-        default="sonnet",
-        help="Claude model to use (default: sonnet)",
-    )
-    parser.add_argument(
-        "--require-commit-confirm",
-        action="store_true",
-        help="Require user confirmation before committing",
-    )
-
-    args = parser.parse_args()
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-
-    # Discover Go modules only
-    print("=== Discover Go Modules ===\n")
-
-    module_paths = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Path does not exist: {path}")
-            return 1
-        module_paths.append(path)
-
-    modules = []
-    for module_path in module_paths:
-        if (module_path / "go.mod").exists():
-            modules.append(module_path)
-        else:
-            discovered = discover_go_modules(module_path, recursive=True)
-            modules.extend(discovered)
-
-    if not modules:
-        print("✗ No Go modules found")
-        return 1
-
-    # Remove duplicates
-    modules = list(dict.fromkeys(modules))
-
-    print(f"Found {len(modules)} Go module(s)\n")
-
-    # Process each module (with dependencies)
-    for i, mod in enumerate(modules, 1):
-        if len(modules) > 1:
-            print(f"\n[{i}/{len(modules)}] {mod.name}")
-        success, _ = await process_module_with_retry(mod, project_type="go", update_deps=True)
-        if not success:
-            return 1
-
-    play_completion_sound()
-    return 0
+    return await _main_go_workflow("Update Go versions and dependencies", update_deps=True)
 
 
 def main_go_with_deps() -> int:
@@ -808,54 +889,31 @@ def main_go_with_deps() -> int:
 
 async def main_python_async() -> int:
     """Python-only async workflow."""
-    parser = argparse.ArgumentParser(
-        description="Update Python dependencies, CHANGELOG, and create git tags"
-    )
-    parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to Python module(s) or parent directories (default: current directory)",
-    )
-    parser.add_argument("--verbose", action="store_true", help="Show full command output")
-    parser.add_argument(
-        "--model",
-        choices=["sonnet", "opus", "haiku"],
-        default="sonnet",
-        help="Claude model to use (default: sonnet)",
+    parser = _build_parser(
+        "Update Python dependencies, CHANGELOG, and create git tags",
+        "Path(s) to Python module(s) or parent directories (default: current directory)",
     )
-    parser.add_argument(
-        "--require-commit-confirm",
-        action="store_true",
-        help="Require user confirmation before committing",
-    )
-
     args = parser.parse_args()
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+    _apply_common_args(args)
 
     # Discover Python modules only
     print("=== Discover Python Modules ===\n")
 
-    module_paths = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Path does not exist: {path}")
-            return 1
-        module_paths.append(path)
+    module_paths = _resolve_paths(args.modules)
+    if module_paths is None:
+        return 1
+
+    is_module = {path: {"pyproject.toml", "uv.lock"} <= marker_files(path) for path in module_paths}
+    searched = await _discover_recursive([path for path in module_paths if not is_module[path]])
 
     modules = []
     legacy = []
     for module_path in module_paths:
-        if (module_path / "pyproject.toml").exists() and (module_path / "uv.lock").exists():
+        if is_module[module_path]:
             modules.append(module_path)
         else:
-            discovered = discover_python_modules(module_path, recursive=True)
-            modules.extend(discovered)
-            legacy.extend(discover_legacy_python_projects(module_path, recursive=True))
+            modules.extend(searched[module_path]["python"])
+            legacy.extend(searched[module_path]["legacy"])
 
     # Warn about legacy projects
     if legacy:
@@ -873,13 +931,8 @@ async def main_python_async() -> int:
 
     print(f"Found {len(modules)} Python module(s)\n")
 
-    # Process each module
-    for i, mod in enumerate(modules, 1):
-        if len(modules) > 1:
-            print(f"\n[{i}/{len(modules)}] {mod.name}")
-        success, _ = await process_module_with_retry(mod, project_type="python")
-        if not success:
-            return 1
+    if not await _process_until_failure(modules, config.MAX_PARALLEL, "python"):
+        return 1
 
     play_completion_sound()
     return 0
@@ -890,6 +943,40 @@ def main_python() -> int:
     return asyncio.run(main_python_async())
 
 
+async def update_dockerfiles(dockerfile_dirs: list[Path]) -> bool:
+    """Update the base images of several Dockerfiles concurrently.
+
+    Each Dockerfile's progress is buffered and printed in the given order once
+    all updates have finished, so the output doesn't interleave.
+
+    Args:
+        dockerfile_dirs: Directories containing a Dockerfile
+
+    Returns:
+        True if any Dockerfile was updated
+    """
+    semaphore = asyncio.Semaphore(max(1, min(8, len(dockerfile_dirs))))
+
+    async def update(directory: Path) -> tuple[bool, list[str]]:
+        lines: list[str] = []
+
+        def log(msg: str, to_console: bool = True) -> None:
+            if to_console or config.VERBOSE_MODE:
+                lines.append(msg)
+
+        async with semaphore:
+            updated, _ = await asyncio.to_thread(update_dockerfile_images, directory, log)
+        return updated, lines
+
+    outcomes = await asyncio.gather(*(update(directory) for directory in dockerfile_dirs))
+
+    for directory, (_, lines) in zip(dockerfile_dirs, outcomes, strict=True):
+        print(f"\n→ {directory}")
+        for line in lines:
+            print(line)
+    return any(updated for updated, _ in outcomes)
+
+
 async def main_docker_async() -> int:
     """Docker-only async workflow (update base images only, no commit)."""
     parser = argparse.ArgumentParser(
@@ -908,27 +995,22 @@ async def main_docker_async() -> int:
 
     print("=== Docker Image Updates ===\n")
 
-    any_updates = False
+    dockerfile_dirs: list[Path] = []
     for path_str in args.paths:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Path does not exist: {path}")
+        try:
+            path = Path(path_str).resolve(strict=True)
+        except OSError, RuntimeError:
+            # Missing, below a regular file, or a symlink loop
+            print(f"✗ Path does not exist: {Path(path_str).absolute()}")
             continue
 
-        dockerfile = path / "Dockerfile"
-        if not dockerfile.exists():
-            # Search for Dockerfiles in subdirectories
-            for df in path.rglob("Dockerfile"):
-                if ".venv" not in df.parts:
-                    print(f"\n→ {df.parent}")
-                    updated, _ = update_dockerfile_images(df.parent, log_func=log_message)
-                    if updated:
-                        any_updates = True
+        if "Dockerfile" in marker_files(path):
+            dockerfile_dirs.append(path)
         else:
-            print(f"\n→ {path}")
-            updated, _ = update_dockerfile_images(path, log_func=log_message)
-            if updated:
-                any_updates = True
+            # Search for Dockerfiles in subdirectories
+            dockerfile_dirs.extend(discover_dockerfile_dirs(path))
+
+    any_updates = await update_dockerfiles(list(dict.fromkeys(dockerfile_dirs)))
 
     if any_updates:
         print("\n✓ Dockerfile(s) updated - review and commit manually")
@@ -973,7 +1055,7 @@ async def process_release_module(module_path: Path) -> tuple[bool, str]:
         log_message(f"Release: {module_path.name}", to_console=True)
         log_message("=" * 70, to_console=True)
         if log_file and not config.VERBOSE_MODE:
-            print(f"  Log: {log_file}")
+            write_console(f"  Log: {log_file}\n")
 
         # Ensure .update-logs/ is in .gitignore
         ensure_gitignore_entry(module_path, log_func=log_message)
@@ -1028,7 +1110,7 @@ async def process_release_with_retry(module_path: Path) -> tuple[bool, str]:
 
     while True:
         if attempt > 1:
-            print(f"\n=== Retrying {module_path} (attempt {attempt}) ===\n")
+            write_console(f"\n=== Retrying {module_path} (attempt {attempt}) ===\n\n")
 
         success, status = await process_release_module(module_path)
 
@@ -1036,13 +1118,13 @@ async def process_release_with_retry(module_path: Path) -> tuple[bool, str]:
             return True, status
 
         play_error_sound()
-        print(f"\n✗ Release failed for {module_path}")
-        print("  → Fix the issues and retry, or skip this module")
+        write_console(f"\n✗ Release failed for {module_path}\n")
+        write_console("  → Fix the issues and retry, or skip this module\n")
 
-        choice = prompt_skip_or_retry()
+        choice = await ask(prompt_skip_or_retry)
 
         if choice == "skip":
-            print(f"⚠ Skipping {module_path}\n")
+            write_console(f"⚠ Skipping {module_path}\n\n")
             return False, "skipped"
 
         attempt += 1
@@ -1057,38 +1139,21 @@ async def main_release_async() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    parser = argparse.ArgumentParser(
-        description="Release unreleased CHANGELOG entries (version bump, commit, tag, push)"
+    parser = _build_parser(
+        "Release unreleased CHANGELOG entries (version bump, commit, tag, push)",
+        "Path(s) to module(s) or parent directories (default: current directory)",
+        confirm_help="Require user confirmation before releasing",
     )
     parser.add_argument(
-        "modules",
-        nargs="*",
-        default=["."],
-        help="Path(s) to module(s) or parent directories (default: current directory)",
-    )
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Show full command output",
-    )
-    parser.add_argument(
-        "--model",
-        choices=["sonnet", "opus", "haiku"],
-        default="sonnet",
-        help="Claude model to use (default: sonnet)",
-    )
-    parser.add_argument(
-        "--require-commit-confirm",
+        "--claude-cache",
         action="store_true",
-        help="Require user confirmation before releasing",
+        help="Reuse cached Claude analyses for unchanged entries (~/.cache/updater/claude)",
     )
 
     args = parser.parse_args()
 
-    config.VERBOSE_MODE = args.verbose
-    config.MODEL = args.model
-    config.REQUIRE_CONFIRM = args.require_commit_confirm
-    config.RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+    _apply_common_args(args)
+    config.CLAUDE_CACHE_ENABLED = args.claude_cache
 
     # Step 0: Verify Claude authentication
     print("=== Step 0: Verify Claude Authentication ===\n")
@@ -1102,21 +1167,21 @@ async def main_release_async() -> int:
     # Resolve module paths
     print("=== Step 1: Discover Modules ===\n")
 
-    module_paths: list[Path] = []
-    for path_str in args.modules:
-        path = Path(path_str).resolve()
-        if not path.exists():
-            print(f"✗ Module path does not exist: {path}")
-            play_completion_sound()
-            return 1
+    paths = _resolve_paths(args.modules)
+    if paths is None:
+        play_completion_sound()
+        return 1
 
-        # Check if this path has a CHANGELOG.md directly
-        if (path / "CHANGELOG.md").exists():
+    # Paths with a CHANGELOG.md directly are modules; the rest are searched recursively
+    has_changelog = {path: "CHANGELOG.md" in marker_files(path) for path in paths}
+    searched = await _discover_recursive([path for path in paths if not has_changelog[path]])
+
+    module_paths: list[Path] = []
+    for path in paths:
+        if has_changelog[path]:
             module_paths.append(path)
         else:
-            # Discover all modules recursively
-            discovered = discover_all_modules(path, recursive=True)
-            for mod_list in discovered.values():
+            for mod_list in searched[path].values():
                 for mod in mod_list:
                     if (mod / "CHANGELOG.md").exists():
                         module_paths.append(mod)
@@ -1135,43 +1200,20 @@ async def main_release_async() -> int:
     print()
 
     # Process each module
-    results = []
-    for i, mod in enumerate(module_paths, 1):
+    async def process(i: int, mod: Path) -> tuple[bool, str]:
         if len(module_paths) > 1:
-            print(f"\n[{i}/{len(module_paths)}] {mod.name}")
+            write_console(f"\n[{i}/{len(module_paths)}] {mod.name}\n")
+        return await process_release_with_retry(mod)
 
-        success, status = await process_release_with_retry(mod)
-        results.append((mod, success, status))
+    results = await run_grouped_by_repo(module_paths, config.MAX_PARALLEL, process)
 
     # Summary
     if len(module_paths) > 1:
-        print("\n" + "=" * 70)
-        print(f"SUMMARY: {len(module_paths)} module(s)")
-        print("=" * 70)
-
-        released = [mod for mod, _, status in results if status == "released"]
-        nothing = [mod for mod, _, status in results if status == "nothing-to-release"]
-        skipped = [mod for mod, _, status in results if status == "skipped"]
-        failed = [mod for mod, _, status in results if status == "failed"]
-
-        if released:
-            print(f"\n✓ Released: {len(released)}")
-            for mod in released:
-                print(f"  - {mod.name}")
-        if nothing:
-            print(f"\n✓ Nothing to release: {len(nothing)}")
-            for mod in nothing:
-                print(f"  - {mod.name}")
-        if skipped:
-            print(f"\n⚠ Skipped: {len(skipped)}")
-            for mod in skipped:
-                print(f"  - {mod.name}")
-        if failed:
-            print(f"\n✗ Failed: {len(failed)}")
-            for mod in failed:
-                print(f"  - {mod.name}")
-
-        print("\n" + "=" * 70)
+        print_summary(
+            f"SUMMARY: {len(module_paths)} module(s)",
+            [(mod, status) for mod, _, status in results],
+            _RELEASE_SUMMARY_SECTIONS,
+        )
 
     play_completion_sound()
     return 0
@@ -1,21 +1,31 @@
 """Configuration constants for the updater."""
 
+from contextvars import ContextVar
 from typing import TextIO
 
 # Logging configuration
 LOG_RETENTION_COUNT = 5
 LOG_DIR_NAME = ".update-logs"
 
-# Global state (set by CLI) - Not thread-safe, CLI uses single-threaded execution only
+# Global state - plain globals are set once by the CLI before any modules run
+# concurrently and only read afterwards (VERBOSE_MODE, RUN_TIMESTAMP, MODEL,
+# REQUIRE_CONFIRM, NO_TAG, MAX_PARALLEL); per-module state lives in ContextVars
+# (LOG_FILE_HANDLE, CONSOLE_BUFFER) so concurrent tasks each get their own
 VERBOSE_MODE = False
 RUN_TIMESTAMP: str | None = None
-LOG_FILE_HANDLE: TextIO | None = None
+# Per-task log file, so modules processed concurrently don't share one
+LOG_FILE_HANDLE: ContextVar[TextIO | None] = ContextVar("LOG_FILE_HANDLE", default=None)
+# Per-task console output, held back while modules are processed concurrently
+CONSOLE_BUFFER: ContextVar[list[str] | None] = ContextVar("CONSOLE_BUFFER", default=None)
 MODEL: str | None = None  # Claude model to use (sonnet, opus, haiku)
 REQUIRE_CONFIRM = False  # Require user confirmation before commits
 NO_TAG = False  # Add to Unreleased instead of creating version/tag
+MAX_PARALLEL = 1  # Git repositories processed concurrently (set by CLI)
 
 # Go updater configuration
 GO_MAX_ITERATIONS = 10
 
 # Claude configuration
 CLAUDE_SESSION_DELAY = 0.5  # seconds between sessions
+CLAUDE_CACHE_ENABLED = False  # Reuse cached analyses for identical prompts (set by CLI)
+CLAUDE_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds before a cached analysis expires
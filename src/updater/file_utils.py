@@ -1,21 +1,32 @@
 """File handling utilities."""
 
 
-def condense_file_list(files: list[str]) -> list[str]:
+def condense_file_list(files: list[str], limit: int | None = None) -> list[str] | None:
     """Condense file list by grouping vendor files.
 
     Args:
         files: List of file paths
+        limit: Optional maximum number of lines; stops early once exceeded
 
     Returns:
-        Condensed list where vendor/* files are grouped as "vendor/** (N files)"
+        Condensed list where vendor/* files are grouped as "vendor/** (N files)",
+        or None if it would be longer than limit
     """
-    vendor_files = [f for f in files if f.startswith("vendor/")]
-    non_vendor_files = [f for f in files if not f.startswith("vendor/")]
+    result = []
+    vendor_count = 0
 
-    result = non_vendor_files.copy()
+    for f in files:
+        if f.startswith("vendor/"):
+            vendor_count += 1
+            continue
+        result.append(f)
+        if limit is not None and len(result) > limit:
+            return None
 
-    if vendor_files:
-        result.append(f"vendor/** ({len(vendor_files)} files)")
+    if vendor_count:
+        result.append(f"vendor/** ({vendor_count} files)")
+
+    if limit is not None and len(result) > limit:
+        return None
 
     return result
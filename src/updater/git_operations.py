@@ -1,10 +1,13 @@
 """Git operations: status, commit, tag, branch management."""
 
+import asyncio
+import functools
 import subprocess
 from collections.abc import Callable
 from pathlib import Path
 
 from . import config
+from .changelog import get_latest_version
 
 
 def find_git_repo(path: Path) -> Path | None:
@@ -16,8 +19,12 @@ def find_git_repo(path: Path) -> Path | None:
     Returns:
         Path to git repository root, or None if not found
     """
-    current = Path(path).resolve()
+    return _find_git_repo_resolved(Path(path).resolve())
 
+
+@functools.lru_cache(maxsize=4096)
+def _find_git_repo_resolved(current: Path) -> Path | None:
+    """Walk up from an already resolved path; cached since modules share repos."""
     while current != current.parent:
         if (current / ".git").exists():
             return current
@@ -78,11 +85,15 @@ def ensure_gitignore_entry(module_path: Path, log_func: Callable[..., None]) ->
             log_func(f"  ✓ Added {entry} to .gitignore", to_console=config.VERBOSE_MODE)
 
 
-def check_git_status(path: Path) -> tuple[int, list[str]]:
-    """Check git status and return (count, files_list).
+async def check_git_status_async(
+    path: Path, include_untracked: bool = True
+) -> tuple[int, list[str]]:
+    """Check git status and return (count, files_list) without blocking the event loop.
 
     Args:
         path: Path to git repository or subdirectory to check
+        include_untracked: Whether to report untracked files; skipping them
+            avoids git's directory scan, the slow part on large repos
 
     Returns:
         Tuple of (number of changed files, list of filenames)
@@ -94,24 +105,84 @@ def check_git_status(path: Path) -> tuple[int, list[str]]:
         Uses git status --porcelain format: XY PATH
         where XY are status chars and PATH is filename
     """
-    # Find git repo root
     git_repo = find_git_repo(path)
     if not git_repo:
         return -1, []
 
-    # Run git status from repo root
-    result = subprocess.run(
-        "git status --porcelain",
-        shell=True,
+    output = await _git_status_output(git_repo, include_untracked)
+    if output is None:
+        return -1, []
+
+    return _parse_git_status(output, path, git_repo)
+
+
+async def check_git_status_many_async(paths: list[Path]) -> list[tuple[int, list[str]]]:
+    """Check git status for several paths, running git once per repository.
+
+    Modules in a monorepo share one repo-wide git status instead of each
+    running their own.
+
+    Args:
+        paths: Paths to git repositories or subdirectories to check
+
+    Returns:
+        (count, files_list) per path, in the order of `paths`
+        (-1, []) for paths whose status could not be determined
+    """
+    repos = {path: find_git_repo(path) for path in paths}
+    unique_repos = list(dict.fromkeys(repo for repo in repos.values() if repo))
+    outputs = dict(
+        zip(
+            unique_repos,
+            await asyncio.gather(*(_git_status_output(repo) for repo in unique_repos)),
+            strict=True,
+        )
+    )
+
+    results: list[tuple[int, list[str]]] = []
+    for path in paths:
+        repo = repos[path]
+        output = outputs.get(repo) if repo else None
+        if repo is None or output is None:
+            results.append((-1, []))
+        else:
+            results.append(_parse_git_status(output, path, repo))
+    return results
+
+
+async def _git_status_output(git_repo: Path, include_untracked: bool = True) -> str | None:
+    """Run git status --porcelain at the repo root; None if git fails."""
+    untracked = "--untracked-files=normal" if include_untracked else "--untracked-files=no"
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "--no-optional-locks",
+        "status",
+        "--porcelain",
+        untracked,
         cwd=git_repo,
-        capture_output=True,
-        text=True,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
+    stdout, _ = await proc.communicate()
+
+    if proc.returncode != 0:
+        return None
+
+    return stdout.decode("utf-8", errors="replace")
 
-    if result.returncode != 0:
-        return -1, []
 
-    lines = [line for line in result.stdout.strip().split("\n") if line]
+def _parse_git_status(output: str, path: Path, git_repo: Path) -> tuple[int, list[str]]:
+    """Parse git status --porcelain output into (count, files_list).
+
+    Args:
+        output: Output of git status --porcelain run at the repo root
+        path: Path the status was requested for
+        git_repo: Git repository root
+
+    Returns:
+        Tuple of (number of changed files, list of filenames)
+    """
+    lines = [line for line in output.strip().split("\n") if line]
 
     # Parse porcelain format: XY PATH (status chars + whitespace + filename)
     # Use split() without args to handle any amount of whitespace
@@ -259,8 +330,6 @@ def ensure_changelog_tag(module_path: Path, log_func: Callable[..., None]) -> bo
     Returns:
         True if a tag was created, False otherwise
     """
-    import re
-
     from . import config
     from .log_manager import run_command
 
@@ -270,15 +339,10 @@ def ensure_changelog_tag(module_path: Path, log_func: Callable[..., None]) -> bo
         return False
 
     # Extract version from CHANGELOG
-    with open(changelog_path) as f:
-        content = f.read()
-
-    version_match = re.search(r"##\s+(v\d+\.\d+\.\d+)", content)
-    if not version_match:
+    tag = get_latest_version(changelog_path)
+    if not tag:
         return False
 
-    tag = version_match.group(1)
-
     # Check if tag already exists
     check_tag = subprocess.run(
         f"git tag -l {tag}",
@@ -316,8 +380,6 @@ def git_tag_from_changelog(module_path: Path, log_func: Callable[..., None]) ->
     Raises:
         GitError: If git operations fail
     """
-    import re
-
     from . import config
     from .log_manager import run_command
 
@@ -349,17 +411,12 @@ def git_tag_from_changelog(module_path: Path, log_func: Callable[..., None]) ->
         log_func("⚠ No CHANGELOG.md found, skipping tag", to_console=True)
         return
 
-    with open(changelog_path) as f:
-        content = f.read()
+    tag = get_latest_version(changelog_path)
 
-    version_match = re.search(r"##\s+(v\d+\.\d+\.\d+)", content)
-
-    if not version_match:
+    if not tag:
         log_func("⚠ Could not find version in CHANGELOG.md", to_console=True)
         return
 
-    tag = version_match.group(1)
-
     log_func(f"→ Creating tag: {tag}", to_console=config.VERBOSE_MODE)
     run_command(
         f'git tag -a {tag} -m "add version {tag}"',
@@ -1,7 +1,9 @@
 """Logging setup, management, and cleanup."""
 
+import contextlib
 import subprocess
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 from . import config
@@ -25,22 +27,24 @@ def setup_module_logging(module_path: Path) -> Path | None:
 
     # Create log file with timestamp
     log_file = log_dir / f"{config.RUN_TIMESTAMP}.log"
-    config.LOG_FILE_HANDLE = open(log_file, "w")
+    handle = open(log_file, "w")
+    config.LOG_FILE_HANDLE.set(handle)
 
     # Write header
-    config.LOG_FILE_HANDLE.write(f"Update Log - {config.RUN_TIMESTAMP}\n")
-    config.LOG_FILE_HANDLE.write(f"Module: {module_path}\n")
-    config.LOG_FILE_HANDLE.write("=" * 70 + "\n\n")
-    config.LOG_FILE_HANDLE.flush()
+    handle.write(f"Update Log - {config.RUN_TIMESTAMP}\n")
+    handle.write(f"Module: {module_path}\n")
+    handle.write("=" * 70 + "\n\n")
+    handle.flush()
 
     return log_file
 
 
 def close_module_logging() -> None:
     """Close the current log file."""
-    if config.LOG_FILE_HANDLE:
-        config.LOG_FILE_HANDLE.close()
-        config.LOG_FILE_HANDLE = None
+    handle = config.LOG_FILE_HANDLE.get()
+    if handle:
+        handle.close()
+        config.LOG_FILE_HANDLE.set(None)
 
 
 def cleanup_old_logs(module_path: Path, keep_count: int | None = None) -> None:
@@ -73,12 +77,52 @@ def log_message(message: str, to_console: bool = True) -> None:
         message: Message to log
         to_console: Whether to also print to console
     """
-    if config.LOG_FILE_HANDLE:
-        config.LOG_FILE_HANDLE.write(message + "\n")
-        config.LOG_FILE_HANDLE.flush()
+    line = message + "\n"
+    handle = config.LOG_FILE_HANDLE.get()
+    if handle:
+        handle.write(line)
+        handle.flush()
 
     if to_console or config.VERBOSE_MODE:
-        print(message)
+        write_console(line)
+
+
+def write_console(text: str) -> None:
+    """Write text to the console, or to the current task's console buffer.
+
+    Args:
+        text: Text to write, including any trailing newline
+    """
+    buffer = config.CONSOLE_BUFFER.get()
+    if buffer is not None:
+        buffer.append(text)
+    else:
+        # One write per call, so lines from concurrent modules never interleave
+        sys.stdout.write(text)
+
+
+def flush_console() -> None:
+    """Write out the current task's buffered console output in one piece."""
+    buffer = config.CONSOLE_BUFFER.get()
+    if buffer:
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
+        buffer.clear()
+
+
+@contextlib.contextmanager
+def buffered_console() -> Iterator[None]:
+    """Hold back the current task's console output until the block exits.
+
+    Used when modules run concurrently, so each module's output appears as
+    one uninterrupted block instead of interleaving with the others.
+    """
+    token = config.CONSOLE_BUFFER.set([])
+    try:
+        yield
+    finally:
+        flush_console()
+        config.CONSOLE_BUFFER.reset(token)
 
 
 def run_command(
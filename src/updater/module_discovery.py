@@ -7,20 +7,40 @@ from pathlib import Path
 # Directories to skip during recursive search (performance optimization)
 SKIP_DIRS = {".venv", "vendor", "node_modules", ".git", "__pycache__"}
 
+# Files that mark a modern (uv-based) Python project
+_MODERN_PYTHON_MARKERS = {"pyproject.toml", "uv.lock"}
 
-def _walk_filtered(parent_path: Path) -> Iterator[Path]:
+
+def _walk_filtered(parent_path: Path) -> Iterator[tuple[Path, set[str]]]:
     """Walk directory tree, skipping SKIP_DIRS for performance.
 
-    Yields paths to all files, excluding files in skipped directories.
+    Yields each directory with the names of the files directly in it, so
+    marker files can be checked without a stat per candidate.
     Much faster than rglob() on large repos with vendor directories.
     """
     for root, dirs, files in os.walk(parent_path):
         # Modify dirs in-place to skip directories
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
-        root_path = Path(root)
-        for file in files:
-            yield root_path / file
+        yield Path(root), set(files)
+
+
+def marker_files(path: Path) -> set[str]:
+    """Return the names of the entries directly in a directory.
+
+    One directory read instead of an exists() stat per marker file.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Entry names, or an empty set if the directory can't be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 def _module_sort_key(module_path: Path, parent_path: Path) -> tuple:
@@ -93,13 +113,13 @@ def discover_go_modules(parent_path: Path, recursive: bool = False) -> list[Path
 
     if recursive:
         # Recursive search - find all go.mod files (skips vendor/node_modules/etc during walk)
-        for item in _walk_filtered(parent):
-            if item.name == "go.mod":
-                modules.append(item.parent)
+        for directory, files in _walk_filtered(parent):
+            if "go.mod" in files:
+                modules.append(directory)
     else:
         # Non-recursive - only direct children (original behavior)
         for item in sorted(parent.iterdir()):
-            if item.is_dir() and (item / "go.mod").exists():
+            if item.is_dir() and "go.mod" in marker_files(item):
                 modules.append(item)
 
     # Sort with custom priority (lib/ first at each level)
@@ -130,18 +150,15 @@ def discover_python_modules(parent_path: Path, recursive: bool = False) -> list[
 
     if recursive:
         # Recursive search - find all pyproject.toml files (skips .venv/vendor/etc during walk)
-        for item in _walk_filtered(parent):
-            if item.name == "pyproject.toml":
-                module_dir = item.parent
-                # Require uv.lock for modern project detection
-                if (module_dir / "uv.lock").exists():
-                    modules.append(module_dir)
+        for directory, files in _walk_filtered(parent):
+            # Require uv.lock for modern project detection
+            if _MODERN_PYTHON_MARKERS <= files:
+                modules.append(directory)
     else:
         # Non-recursive - only direct children
         for item in sorted(parent.iterdir()):
-            if item.is_dir():
-                if (item / "pyproject.toml").exists() and (item / "uv.lock").exists():
-                    modules.append(item)
+            if item.is_dir() and _MODERN_PYTHON_MARKERS <= marker_files(item):
+                modules.append(item)
 
     # Sort alphabetically
     modules.sort()
@@ -165,12 +182,15 @@ def is_legacy_python_project(path: Path) -> bool:
     Returns:
         True if legacy Python project, False otherwise
     """
-    path = Path(path)
+    return _is_legacy_python_files(marker_files(Path(path)))
 
-    has_requirements = (path / "requirements.txt").exists()
-    has_setup_py = (path / "setup.py").exists()
-    has_pyproject = (path / "pyproject.toml").exists()
-    has_uv_lock = (path / "uv.lock").exists()
+
+def _is_legacy_python_files(files: set[str]) -> bool:
+    """Apply the is_legacy_python_project rules to a directory's file names."""
+    has_requirements = "requirements.txt" in files
+    has_setup_py = "setup.py" in files
+    has_pyproject = "pyproject.toml" in files
+    has_uv_lock = "uv.lock" in files
 
     # Modern uv project - not legacy
     if has_pyproject and has_uv_lock:
@@ -202,11 +222,9 @@ def discover_legacy_python_projects(parent_path: Path, recursive: bool = False)
 
     if recursive:
         # Find requirements.txt and setup.py files (skips .venv/vendor/node_modules during walk)
-        for item in _walk_filtered(parent):
-            if item.name == "requirements.txt" or item.name == "setup.py":
-                project_dir = item.parent
-                if is_legacy_python_project(project_dir) and project_dir not in projects:
-                    projects.append(project_dir)
+        for directory, files in _walk_filtered(parent):
+            if _is_legacy_python_files(files):
+                projects.append(directory)
     else:
         for item in sorted(parent.iterdir()):
             if item.is_dir() and is_legacy_python_project(item):
@@ -216,6 +234,11 @@ def discover_legacy_python_projects(parent_path: Path, recursive: bool = False)
     return projects
 
 
+def _is_standalone_docker_files(files: set[str]) -> bool:
+    """Check for a Dockerfile that doesn't belong to a Go or Python module."""
+    return "Dockerfile" in files and "go.mod" not in files and "pyproject.toml" not in files
+
+
 def discover_docker_projects(parent_path: Path, recursive: bool = False) -> list[Path]:
     """Discover standalone Docker projects (Dockerfile without go.mod/pyproject.toml).
 
@@ -231,31 +254,40 @@ def discover_docker_projects(parent_path: Path, recursive: bool = False) -> list
 
     if recursive:
         # Find all Dockerfiles (skips .venv/vendor/node_modules during walk)
-        for item in _walk_filtered(parent):
-            if item.name == "Dockerfile":
-                project_dir = item.parent
-                # Only include if NOT a Go or Python module
-                has_go_mod = (project_dir / "go.mod").exists()
-                has_python = (project_dir / "pyproject.toml").exists()
-                if not has_go_mod and not has_python:
-                    projects.append(project_dir)
+        for directory, files in _walk_filtered(parent):
+            if _is_standalone_docker_files(files):
+                projects.append(directory)
     else:
         for item in sorted(parent.iterdir()):
-            if item.is_dir():
-                dockerfile = item / "Dockerfile"
-                if dockerfile.exists():
-                    # Only include if NOT a Go or Python module
-                    has_go_mod = (item / "go.mod").exists()
-                    has_python = (item / "pyproject.toml").exists()
-                    if not has_go_mod and not has_python:
-                        projects.append(item)
-
-    # Remove duplicates and sort
-    projects = list(dict.fromkeys(projects))
+            if item.is_dir() and _is_standalone_docker_files(marker_files(item)):
+                projects.append(item)
+
     projects.sort()
     return projects
 
 
+def discover_dockerfile_dirs(parent_path: Path) -> list[Path]:
+    """Find every directory below parent_path that contains a Dockerfile.
+
+    Unlike discover_docker_projects, this includes the Dockerfiles of Go and
+    Python modules, and only skips .venv directories: Dockerfiles under
+    vendor/ or node_modules/ are updated as well.
+
+    Args:
+        parent_path: Parent directory to search in
+
+    Returns:
+        Sorted list of directories containing a Dockerfile
+    """
+    found = []
+    for root, dirs, files in os.walk(parent_path):
+        # Prune virtualenvs before descending instead of filtering their hits
+        dirs[:] = [d for d in dirs if d != ".venv"]
+        if "Dockerfile" in files:
+            found.append(Path(root))
+    return sorted(found)
+
+
 def discover_all_modules(parent_path: Path, recursive: bool = False) -> dict[str, list[Path]]:
     """Discover all modules (Go, Python, and Docker) in a directory.
 
@@ -266,9 +298,30 @@ def discover_all_modules(parent_path: Path, recursive: bool = False) -> dict[str
     Returns:
         Dictionary with keys 'go', 'python', 'docker', 'legacy' mapping to lists of paths
     """
-    return {
-        "go": discover_go_modules(parent_path, recursive=recursive),
-        "python": discover_python_modules(parent_path, recursive=recursive),
-        "docker": discover_docker_projects(parent_path, recursive=recursive),
-        "legacy": discover_legacy_python_projects(parent_path, recursive=recursive),
-    }
+    if not recursive:
+        return {
+            "go": discover_go_modules(parent_path),
+            "python": discover_python_modules(parent_path),
+            "docker": discover_docker_projects(parent_path),
+            "legacy": discover_legacy_python_projects(parent_path),
+        }
+
+    # Classify every directory in a single walk instead of one walk per project type
+    parent = Path(parent_path)
+    found: dict[str, list[Path]] = {"go": [], "python": [], "docker": [], "legacy": []}
+    for directory, files in _walk_filtered(parent):
+        if "go.mod" in files:
+            found["go"].append(directory)
+        if _MODERN_PYTHON_MARKERS <= files:
+            found["python"].append(directory)
+        if _is_standalone_docker_files(files):
+            found["docker"].append(directory)
+        if _is_legacy_python_files(files):
+            found["legacy"].append(directory)
+
+    # Same ordering as the individual discover_* functions
+    found["go"].sort(key=lambda m: _module_sort_key(m, parent))
+    found["python"].sort()
+    found["docker"].sort()
+    found["legacy"].sort()
+    return found
@@ -6,6 +6,7 @@ update workflows. Commands are recipes — specific combinations of steps.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,7 +18,9 @@ from .changelog import (
     add_to_unreleased,
     bump_version,
     extract_current_version,
+    get_latest_version,
     get_unreleased_entries,
+    insert_before_first_version,
     promote_unreleased_to_version,
     update_changelog_with_suggestions,
 )
@@ -25,7 +28,7 @@ from .claude_analyzer import analyze_changes_with_claude, analyze_unreleased_for
 from .docker_updater import update_dockerfile_images
 from .file_utils import condense_file_list
 from .git_operations import (
-    check_git_status,
+    check_git_status_async,
     ensure_changelog_tag,
     git_commit,
     git_push,
@@ -34,8 +37,8 @@ from .git_operations import (
 from .go_updater import run_precommit as run_go_precommit
 from .go_updater import update_go_dependencies
 from .gomod_excludes import apply_gomod_excludes_and_replaces
-from .log_manager import log_message
-from .prompts import prompt_yes_no
+from .log_manager import log_message, write_console
+from .prompts import ask, prompt_yes_no
 from .python_updater import run_precommit as run_python_precommit
 from .python_updater import update_python_dependencies
 from .python_version_updater import update_python_versions
@@ -91,7 +94,7 @@ class GoVersionUpdateStep(Step):
     """Update Go/Alpine versions in go.mod, Dockerfile, CI configs."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        updates = update_versions(module_path, log_func=log_message)
+        updates = await asyncio.to_thread(update_versions, module_path, log_func=log_message)
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updates
         return StepResult(StepStatus.SUCCESS, {"changes": updates})
@@ -102,7 +105,9 @@ class GoExcludesStep(Step):
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
         log_message("\n=== Phase 1b: Apply Standard Excludes/Replaces ===", to_console=True)
-        updates = apply_gomod_excludes_and_replaces(module_path, log_func=log_message)
+        updates = await asyncio.to_thread(
+            apply_gomod_excludes_and_replaces, module_path, log_func=log_message
+        )
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updates
         return StepResult(StepStatus.SUCCESS, {"changes": updates})
@@ -112,7 +117,7 @@ class GoDepUpdateStep(Step):
     """Update Go dependencies via go get -u."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        updates = update_go_dependencies(module_path, log_func=log_message)
+        updates = await asyncio.to_thread(update_go_dependencies, module_path, log_func=log_message)
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updates
         return StepResult(StepStatus.SUCCESS, {"changes": updates})
@@ -131,7 +136,7 @@ class PythonVersionUpdateStep(Step):
     """Update Python version in .python-version, pyproject.toml, Dockerfile."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        updates = update_python_versions(module_path, log_func=log_message)
+        updates = await asyncio.to_thread(update_python_versions, module_path, log_func=log_message)
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updates
         return StepResult(StepStatus.SUCCESS, {"changes": updates})
@@ -141,7 +146,9 @@ class PythonDepUpdateStep(Step):
     """Update Python dependencies via uv sync --upgrade."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        updates = update_python_dependencies(module_path, log_func=log_message)
+        updates = await asyncio.to_thread(
+            update_python_dependencies, module_path, log_func=log_message
+        )
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updates
         return StepResult(StepStatus.SUCCESS, {"changes": updates})
@@ -151,7 +158,9 @@ class DockerUpdateStep(Step):
     """Update Dockerfile base image versions."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        updated, updates = update_dockerfile_images(module_path, log_func=log_message)
+        updated, updates = await asyncio.to_thread(
+            update_dockerfile_images, module_path, log_func=log_message
+        )
         context["docker_updates"] = updates
         context.setdefault("updates_made", False)
         context["updates_made"] = context["updates_made"] or updated
@@ -176,10 +185,15 @@ class CheckChangesStep(Step):
         self._phase = phase
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        change_count, files = check_git_status(module_path)
+        updates_made = context.get("updates_made", False)
+        # After precommit on a fresh update only tracked files matter; leftovers
+        # from a previous run may be untracked-only, so keep them visible then
+        include_untracked = not (self._phase == "precommit" and updates_made)
+        change_count, files = await check_git_status_async(
+            module_path, include_untracked=include_untracked
+        )
         context["change_count"] = change_count
         context["files"] = files
-        updates_made = context.get("updates_made", False)
 
         if change_count == 0 and not updates_made:
             log_message("\n✓ No updates needed - module is already up to date", to_console=True)
@@ -209,8 +223,8 @@ class CheckChangesStep(Step):
             )
 
         # Show condensed file list if 20 or fewer lines
-        condensed_files = condense_file_list(files)
-        if len(condensed_files) <= 20:
+        condensed_files = condense_file_list(files, limit=20)
+        if condensed_files is not None:
             for f in condensed_files:
                 log_message(f"  {f}", to_console=True)
 
@@ -230,9 +244,9 @@ class PrecommitStep(Step):
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
         if self._project_type == "python":
-            run_python_precommit(module_path, log_func=log_message)
+            await asyncio.to_thread(run_python_precommit, module_path, log_func=log_message)
         else:
-            run_go_precommit(module_path, log_func=log_message)
+            await asyncio.to_thread(run_go_precommit, module_path, log_func=log_message)
         return StepResult(StepStatus.SUCCESS)
 
 
@@ -329,7 +343,7 @@ class GitConfirmStep(Step):
             "\nProceed with commit and tag?" if has_tag else "\nProceed with commit (no tag)?"
         )
 
-        if not prompt_yes_no(prompt_msg, default_yes=True):
+        if not await ask(prompt_yes_no, prompt_msg, default_yes=True):
             log_message("\n⚠ Skipped by user", to_console=True)
             log_message("  Changes are staged but not committed", to_console=True)
             return StepResult(StepStatus.SKIP)
@@ -347,15 +361,15 @@ class GitCommitStep(Step):
             # Normal flow: commit changes
             analysis = context.get("analysis", {})
             commit_message = context.get("commit_message", analysis.get("commit_message", "Update"))
-            git_commit(module_path, commit_message, log_func=log_message)
+            await asyncio.to_thread(git_commit, module_path, commit_message, log_func=log_message)
 
         no_tag = context.get("no_tag", False)
 
         if context.get("ensure_changelog_tag"):
-            ensure_changelog_tag(module_path, log_func=log_message)
+            await asyncio.to_thread(ensure_changelog_tag, module_path, log_func=log_message)
 
         if not no_tag and "new_version" in context:
-            git_tag_from_changelog(module_path, log_func=log_message)
+            await asyncio.to_thread(git_tag_from_changelog, module_path, log_func=log_message)
             if tag_only:
                 log_message("\n✓ Missing tag created successfully!", to_console=True)
             else:
@@ -370,7 +384,7 @@ class GitPushStep(Step):
     """Push commits and tags to remote."""
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
-        git_push(module_path, log_func=log_message)
+        await asyncio.to_thread(git_push, module_path, log_func=log_message)
         return StepResult(StepStatus.SUCCESS)
 
 
@@ -391,33 +405,13 @@ class ReleaseStep(Step):
         with open(changelog_path) as f:
             content = f.read()
 
-        # Find first version section
-        lines = content.split("\n")
-        insert_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("## v"):
-                insert_idx = i
-                break
-
-        # Build new section
+        # Build new section and place it before the first version section
         entries_text = "\n".join(entries)
         new_section = f"## Unreleased\n\n{entries_text}\n"
-
-        lines.insert(insert_idx, new_section)
+        content = insert_before_first_version(content, new_section)
 
         with open(changelog_path, "w") as f:
-            f.write("\n".join(lines))
-
-    def _get_latest_changelog_version(self, changelog_path: Path) -> str | None:
-        """Get the latest version from CHANGELOG.md (first ## vX.Y.Z section)."""
-        import re
-
-        with open(changelog_path) as f:
-            content = f.read()
-
-        # Find first version section (skip ## Unreleased if present)
-        match = re.search(r"##\s+(v\d+\.\d+\.\d+)", content)
-        return match.group(1) if match else None
+            f.write(content)
 
     async def run(self, module_path: Path, context: dict[str, Any]) -> StepResult:
         from .claude_analyzer import generate_changelog_from_commits
@@ -450,7 +444,7 @@ class ReleaseStep(Step):
 
         if entries is None:
             # No ## Unreleased section - check if latest CHANGELOG version is missing a tag
-            changelog_version = self._get_latest_changelog_version(changelog_path)
+            changelog_version = get_latest_version(changelog_path)
 
             if changelog_version and changelog_version != latest_tag:
                 # CHANGELOG has a version that's not tagged - just tag it
@@ -501,19 +495,22 @@ class ReleaseStep(Step):
         log_message(f"  New version: {new_version}", to_console=True)
 
         # Show summary
-        print("\n" + "=" * 60)
-        print(f"READY TO RELEASE: {module_path.name}")
-        print("=" * 60)
-        print(f"Version:        {old_version} → {new_version} ({analysis['version_bump']} bump)")
-        print(f"Commit message: Release {new_version}")
-        print(f"Git tag:        {new_version}")
-        print("\nUnreleased entries:")
-        for entry in entries:
-            print(f"  {entry}")
-        print("=" * 60)
+        lines = [
+            "",
+            "=" * 60,
+            f"READY TO RELEASE: {module_path.name}",
+            "=" * 60,
+            f"Version:        {old_version} → {new_version} ({analysis['version_bump']} bump)",
+            f"Commit message: Release {new_version}",
+            f"Git tag:        {new_version}",
+            "\nUnreleased entries:",
+            *(f"  {entry}" for entry in entries),
+            "=" * 60,
+        ]
+        write_console("\n".join(lines) + "\n")
 
         if config.REQUIRE_CONFIRM:
-            if not prompt_yes_no("\nProceed with release?", default_yes=True):
+            if not await ask(prompt_yes_no, "\nProceed with release?", default_yes=True):
                 log_message("\n⚠ Skipped by user", to_console=True)
                 return StepResult(StepStatus.SKIP)
 
@@ -539,7 +536,7 @@ class DockerCommitStep(Step):
         if not updates:
             return StepResult(StepStatus.UP_TO_DATE)
 
-        change_count, _ = check_git_status(module_path)
+        change_count, _ = await check_git_status_async(module_path)
         if change_count == 0:
             log_message(
                 "\n✓ Dockerfile updated (already matches committed version)",
@@ -550,10 +547,10 @@ class DockerCommitStep(Step):
         if len(updates) == 1:
             commit_msg = f"Update Dockerfile: {updates[0]}"
         else:
-            commit_msg = "Update Dockerfile images\n\n" + "\n".join(f"- {u}" for u in updates)
+            commit_msg = "\n".join(["Update Dockerfile images", "", *(f"- {u}" for u in updates)])
 
         log_message("\n=== Committing Changes ===", to_console=True)
-        git_commit(module_path, commit_msg, log_func=log_message)
+        await asyncio.to_thread(git_commit, module_path, commit_msg, log_func=log_message)
         log_message("\n✓ Dockerfile updated and committed", to_console=True)
         return StepResult(StepStatus.SUCCESS)
 
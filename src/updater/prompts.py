@@ -1,7 +1,64 @@
 """User input prompts."""
 
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from . import config
+from .log_manager import flush_console
 from .sound import play_interaction_sound
 
+# Serializes prompts, so concurrently processed modules ask one question at a time
+_PROMPT_LOCK = asyncio.Lock()
+
+
+async def ask(prompt: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Ask a blocking prompt without stalling the other modules in flight.
+
+    With --jobs > 1 the prompt runs in a daemon thread, one prompt at a time,
+    so the event loop keeps serving the other modules while the user answers.
+    A daemon thread (rather than asyncio.to_thread) keeps Ctrl+C exiting
+    immediately instead of waiting for input() to return. Serial runs prompt
+    directly.
+
+    Args:
+        prompt: Prompt function, e.g. prompt_yes_no
+        *args: Positional arguments for the prompt
+        **kwargs: Keyword arguments for the prompt
+
+    Returns:
+        The prompt's answer
+    """
+    if config.MAX_PARALLEL <= 1:
+        return prompt(*args, **kwargs)
+
+    async with _PROMPT_LOCK:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        # Copy the context so the prompt flushes this module's console buffer
+        context = contextvars.copy_context()
+
+        def settle(result: Any, error: BaseException | None) -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def run() -> None:
+            try:
+                result = context.run(prompt, *args, **kwargs)
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, None, e)
+            else:
+                loop.call_soon_threadsafe(settle, result, None)
+
+        threading.Thread(target=run, daemon=True).start()
+        return await future
+
 
 def prompt_yes_no(message: str, default_yes: bool = True) -> bool:
     """Prompt user with Y/n question. Returns True for yes, False for no.
@@ -19,6 +76,7 @@ def prompt_yes_no(message: str, default_yes: bool = True) -> bool:
     - n/no: no
     - Ctrl+C: exits immediately
     """
+    flush_console()  # Show the module's held-back output before asking
     play_interaction_sound()
     prompt = f"{message} [{'Y/n' if default_yes else 'y/N'}]: "
     response = input(prompt).strip().lower()
@@ -46,6 +104,7 @@ def prompt_skip_or_retry(message: str = "Skip or Retry?") -> str:
     - r/retry/Enter: retry this module (default)
     - Ctrl+C: exits immediately
     """
+    flush_console()  # Show the module's held-back output before asking
     play_interaction_sound()
     prompt = f"{message} [s/R]: "
     response = input(prompt).strip().lower()
@@ -3,10 +3,14 @@
 import pytest
 
 from updater.changelog import (
+    add_to_unreleased,
     bump_version,
     extract_current_version,
+    get_latest_version,
     get_unreleased_entries,
+    insert_before_first_version,
     promote_unreleased_to_version,
+    update_changelog_with_suggestions,
 )
 from updater.exceptions import ChangelogError
 
@@ -72,6 +76,22 @@ def test_extract_current_version_no_version(tmp_path):
         extract_current_version(changelog_path)
 
 
+def test_get_latest_version_skips_unreleased(tmp_path):
+    """Test get_latest_version returns the first versioned header."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\n## Unreleased\n\n- New\n\n## v1.2.3\n\n- Old\n")
+
+    assert get_latest_version(changelog_path) == "v1.2.3"
+
+
+def test_get_latest_version_no_version(tmp_path):
+    """Test get_latest_version returns None without a versioned header."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\nNo versions here!")
+
+    assert get_latest_version(changelog_path) is None
+
+
 # ---------------------------------------------------------------------------
 # get_unreleased_entries
 # ---------------------------------------------------------------------------
@@ -193,3 +213,97 @@ def test_promote_unreleased_to_version_no_unreleased_section(tmp_path):
 
     with pytest.raises(ChangelogError, match="No ## Unreleased section"):
         promote_unreleased_to_version(changelog_path, "v1.1.0")
+
+
+# ---------------------------------------------------------------------------
+# update_changelog_with_suggestions
+# ---------------------------------------------------------------------------
+
+
+def test_insert_before_first_version_without_versions():
+    """Test insert_before_first_version puts the section on top without versions."""
+    assert insert_before_first_version("# Changelog\n", "## v0.1.0\n") == (
+        "## v0.1.0\n\n# Changelog\n"
+    )
+
+
+def test_update_changelog_with_suggestions(tmp_path, sample_changelog):
+    """Test update_changelog_with_suggestions inserts a new version section."""
+    analysis = {"version_bump": "minor", "changelog": ["- Add feature"]}
+
+    new_version = update_changelog_with_suggestions(
+        tmp_path, analysis, log_func=lambda *a, **k: None
+    )
+
+    assert new_version == "v0.3.0"
+    content = sample_changelog.read_text()
+    assert content.startswith("# Changelog\n\n## v0.3.0\n\n- Add feature\n\n## v0.2.1\n")
+
+
+# ---------------------------------------------------------------------------
+# add_to_unreleased
+# ---------------------------------------------------------------------------
+
+
+def test_add_to_unreleased_appends_to_existing_section(tmp_path):
+    """Test add_to_unreleased appends bullets after existing Unreleased entries."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\n## Unreleased\n\n- Old\n\n## v1.0.0\n\n- Init\n")
+
+    add_to_unreleased(tmp_path, {"changelog": ["New"]}, log_func=lambda *a, **k: None)
+
+    assert changelog_path.read_text() == (
+        "# Changelog\n\n## Unreleased\n\n- Old\n- New\n\n## v1.0.0\n\n- Init\n"
+    )
+
+
+def test_add_to_unreleased_appends_when_section_ends_file(tmp_path):
+    """Test add_to_unreleased appends in place when Unreleased is the last section."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\n## Unreleased\n\n- Old\n")
+
+    add_to_unreleased(tmp_path, {"changelog": ["New"]}, log_func=lambda *a, **k: None)
+
+    assert changelog_path.read_text() == "# Changelog\n\n## Unreleased\n\n- Old\n- New\n"
+
+
+def test_add_to_unreleased_creates_section_before_first_version(tmp_path, sample_changelog):
+    """Test add_to_unreleased creates the Unreleased section above the latest version."""
+    add_to_unreleased(tmp_path, {"changelog": ["New"]}, log_func=lambda *a, **k: None)
+
+    assert sample_changelog.read_text().startswith(
+        "# Changelog\n\n## Unreleased\n\n- New\n\n## v0.2.1\n"
+    )
+
+
+def test_add_to_unreleased_without_versions(tmp_path):
+    """Test add_to_unreleased appends the section after the preamble."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\n")
+
+    add_to_unreleased(tmp_path, {"changelog": ["New"]}, log_func=lambda *a, **k: None)
+
+    assert changelog_path.read_text() == "# Changelog\n\n## Unreleased\n\n- New\n\n\n"
+
+
+def test_add_to_unreleased_keeps_leading_dashes_in_text(tmp_path):
+    """Test only the bullet marker is stripped, not dashes belonging to the entry."""
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text("# Changelog\n\n## Unreleased\n\n- Old\n")
+
+    add_to_unreleased(
+        tmp_path,
+        {"changelog": ["- Add --jobs flag", "--verbose shows output"]},
+        log_func=lambda *a, **k: None,
+    )
+
+    assert changelog_path.read_text() == (
+        "# Changelog\n\n## Unreleased\n\n- Old\n- Add --jobs flag\n- --verbose shows output\n"
+    )
+
+
+def test_add_to_unreleased_missing_file(tmp_path):
+    """Test add_to_unreleased skips without creating a CHANGELOG."""
+    add_to_unreleased(tmp_path, {"changelog": ["New"]}, log_func=lambda *a, **k: None)
+
+    assert not (tmp_path / "CHANGELOG.md").exists()
@@ -6,10 +6,21 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from updater import config
+from updater import claude_analyzer, config
 from updater.claude_analyzer import (
+    _POOL_MAX_QUERIES,
+    ClaudePool,
+    _backoff_delay,
+    _cache_path,
+    _collect_diffs,
+    _extract_json,
+    _read_cached_analysis,
+    _run_git_command,
+    _write_cached_analysis,
     analyze_changes_with_claude,
+    analyze_unreleased_for_release,
     generate_changelog_from_commits,
+    shared_claude_session,
     verify_claude_auth,
 )
 from updater.exceptions import ClaudeError
@@ -21,9 +32,24 @@ def reset_config():
     config.VERBOSE_MODE = False
     config.MODEL = "sonnet"
     config.CLAUDE_SESSION_DELAY = 0.1
+    config.CLAUDE_CACHE_ENABLED = False
+    claude_analyzer._last_session_end = None
+    claude_analyzer._get_clean_config_dir.cache_clear()
+    claude_analyzer._claude_env.cache_clear()
+    claude_analyzer._claude_options.cache_clear()
     yield
 
 
+@pytest.fixture(autouse=True)
+def stub_diffs():
+    """Give analyses a non-empty diff so they reach Claude."""
+    with patch(
+        "updater.claude_analyzer._collect_diffs",
+        AsyncMock(return_value=("=== go.mod ===\n+go 1.23", True)),
+    ) as mock_collect:
+        yield mock_collect
+
+
 @pytest.fixture
 def mock_module_path(tmp_path):
     """Create a mock module directory."""
@@ -369,7 +395,7 @@ class TestAnalyzeChangesWithClaude:
 
     @pytest.mark.asyncio
     async def test_session_delay_applied(self, mock_module_path, reset_config):
-        """Test that session delay is applied after analysis."""
+        """Test that session delay is applied between analyses, not after the last."""
         config.CLAUDE_SESSION_DELAY = 0.5
 
         mock_response = {
@@ -378,17 +404,315 @@ class TestAnalyzeChangesWithClaude:
             "commit_message": "update deps",
         }
 
-        mock_client = create_mock_client(json.dumps(mock_response))
         mock_sleep = AsyncMock()
 
         with (
-            patch("updater.claude_analyzer.ClaudeSDKClient", return_value=mock_client),
+            patch(
+                "updater.claude_analyzer.ClaudeSDKClient",
+                side_effect=lambda **_: create_mock_client(json.dumps(mock_response)),
+            ),
             patch("asyncio.sleep", mock_sleep),
         ):
             await analyze_changes_with_claude(mock_module_path)
+            mock_sleep.assert_not_called()
+
+            await analyze_changes_with_claude(mock_module_path)
+
+            # Verify the second session waited out the remaining delay
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args[0][0] <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_retries_on_timeout(self, mock_module_path, reset_config):
+        """Test a timeout is retried and the next attempt's answer is returned."""
+        mock_client_class = Mock(
+            side_effect=[
+                Exception("Control request timeout"),
+                create_mock_client(json.dumps({"version_bump": "minor"})),
+            ]
+        )
+
+        with (
+            patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await analyze_changes_with_claude(mock_module_path)
+
+        assert result["version_bump"] == "minor"
+        assert mock_client_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_object_json_raises(self, mock_module_path, reset_config):
+        """Test a JSON reply that is not an object raises ClaudeError."""
+        mock_client = create_mock_client("[1, 2]")
+
+        with (
+            patch("updater.claude_analyzer.ClaudeSDKClient", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(ClaudeError, match="not a JSON object"),
+        ):
+            await analyze_changes_with_claude(mock_module_path)
+
+    @pytest.mark.asyncio
+    async def test_no_diffs_skips_claude(self, mock_module_path, reset_config, stub_diffs):
+        """Test an empty git diff returns a no-bump analysis without a Claude session."""
+        stub_diffs.return_value = ("", False)
+        mock_client_class = Mock()
+
+        with patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class):
+            result = await analyze_changes_with_claude(mock_module_path)
+
+        assert result["version_bump"] == "none"
+        assert result["changelog"] == []
+        mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_uncollected_changes_fail_loudly(
+        self, mock_module_path, reset_config, stub_diffs
+    ):
+        """Test changes git reported but that yield no diff are not treated as "none"."""
+        stub_diffs.return_value = ("", True)
+        mock_client_class = Mock()
+
+        with (
+            patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class),
+            pytest.raises(ClaudeError, match="no diff could be collected"),
+        ):
+            await analyze_changes_with_claude(mock_module_path)
+
+        mock_client_class.assert_not_called()
+
+
+class TestSharedClaudeSession:
+    """Tests for the shared Claude session pool."""
+
+    @pytest.mark.asyncio
+    async def test_analyses_share_one_session(self, mock_module_path, reset_config):
+        """Test consecutive analyses reuse one connected client."""
+        mock_client = create_mock_client(json.dumps({"version_bump": "patch"}))
+        mock_client_class = Mock(return_value=mock_client)
+
+        with (
+            patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            async with shared_claude_session():
+                await analyze_changes_with_claude(mock_module_path)
+                await analyze_unreleased_for_release(["- Fix bug"], "test-module")
+
+        mock_client_class.assert_called_once()
+        mock_client.connect.assert_awaited_once()
+        assert mock_client.query.await_count == 2
+        mock_client.disconnect.assert_awaited_once()
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queries_do_not_see_earlier_prompts(self, reset_config):
+        """Test a second query starts a conversation without the first prompt."""
+        conversations: dict[str, list[str]] = {}
+        mock_client = create_mock_client("ok")
+
+        async def record_query(prompt, session_id="default"):
+            conversations.setdefault(session_id, []).append(prompt)
+
+        mock_client.query = AsyncMock(side_effect=record_query)
+
+        with patch("updater.claude_analyzer.ClaudeSDKClient", Mock(return_value=mock_client)):
+            async with ClaudePool() as pool:
+                await pool.query("diff of module-a")
+                await pool.query("diff of module-b")
+
+        second_session = mock_client.query.await_args_list[1].kwargs["session_id"]
+        assert conversations[second_session] == ["diff of module-b"]
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_bounded_queries(self, reset_config):
+        """Test the shared connection is renewed after _POOL_MAX_QUERIES queries."""
+        mock_client_class = Mock(side_effect=lambda **_: create_mock_client("ok"))
+
+        with patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class):
+            async with ClaudePool() as pool:
+                for _ in range(_POOL_MAX_QUERIES + 1):
+                    await pool.query("prompt")
+
+        assert mock_client_class.call_count == 2
+
+
+class TestClaudeCache:
+    """Tests for the on-disk Claude analysis cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_analysis_served_from_cache(
+        self, mock_module_path, reset_config, tmp_path
+    ):
+        """Test an identical prompt is answered from disk without a new session."""
+        config.CLAUDE_CACHE_ENABLED = True
+        mock_response = {
+            "version_bump": "minor",
+            "changelog": ["add feature"],
+            "commit_message": "add feature",
+        }
+        mock_client_class = Mock(return_value=create_mock_client(json.dumps(mock_response)))
+
+        with (
+            patch("updater.claude_analyzer.Path.home", return_value=tmp_path),
+            patch("updater.claude_analyzer.ClaudeSDKClient", mock_client_class),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            first = await analyze_changes_with_claude(mock_module_path)
+            second = await analyze_changes_with_claude(mock_module_path)
+
+        assert first == second == mock_response
+        mock_client_class.assert_called_once()
+        assert list((tmp_path / ".cache" / "updater" / "claude").glob("*/*.json"))
+
+    def test_write_uses_unique_temp_file(self, reset_config, tmp_path):
+        """Test writers don't share a fixed temp path and leave no temp files behind."""
+        config.CLAUDE_CACHE_ENABLED = True
+
+        with patch("updater.claude_analyzer.Path.home", return_value=tmp_path):
+            cache_path = _cache_path("prompt")
+            # Something occupying the old fixed temp path must not block the write
+            cache_path.with_suffix(".tmp").mkdir(parents=True)
+            _write_cached_analysis("prompt", {"version_bump": "patch"})
+
+            assert _read_cached_analysis("prompt") == {"version_bump": "patch"}
+        assert [p.name for p in cache_path.parent.iterdir() if p.is_file()] == [cache_path.name]
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, mock_module_path, reset_config, tmp_path):
+        """Test nothing is written to the cache unless enabled."""
+        mock_client = create_mock_client(json.dumps({"version_bump": "patch"}))
+
+        with (
+            patch("updater.claude_analyzer.Path.home", return_value=tmp_path),
+            patch("updater.claude_analyzer.ClaudeSDKClient", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            await analyze_changes_with_claude(mock_module_path)
+
+        assert not (tmp_path / ".cache").exists()
+
+
+class TestCollectDiffs:
+    """Tests for _collect_diffs function."""
+
+    async def test_splits_dependency_diffs_per_file(self, tmp_git_repo):
+        """Test one git diff is split into dependency files and code changes."""
+        import subprocess
+
+        module = tmp_git_repo / "svc"
+        module.mkdir()
+        (module / "go.mod").write_text("module svc\n")
+        (module / "pyproject.toml").write_text("[project]\n")
+        (module / "main.go").write_text("package main\n")
+        (module / "api.pb.go").write_text("package main\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "init"], cwd=tmp_git_repo, check=True)
+
+        (module / "go.mod").write_text("module svc\n\ngo 1.23\n")
+        (module / "pyproject.toml").write_text("[project]\nname = 'svc'\n")
+        (module / "main.go").write_text("package main\n\nfunc main() {}\n")
+        (module / "api.pb.go").write_text("package main\n\n// regenerated\n")
+
+        diffs, has_changes = await _collect_diffs(module, "")
+
+        assert has_changes
+
+        go_mod, pyproject, code = diffs.split("\n\n=== ")
+        assert go_mod.startswith("=== go.mod ===\n")
+        assert "go 1.23" in go_mod
+        assert "name = 'svc'" not in go_mod
+        assert pyproject.startswith("pyproject.toml ===\n")
+        assert "name = 'svc'" in pyproject
+        assert code.startswith("code_changes ===\n")
+        assert "func main()" in code
+        assert "go 1.23" not in code
+        assert "regenerated" not in code
+
+    async def test_keeps_paths_with_spaces_and_non_ascii(self, tmp_git_repo):
+        """Test changes to unusual file names reach the code section."""
+        import subprocess
+
+        (tmp_git_repo / "my file.go").write_text("package main\n")
+        (tmp_git_repo / "ö.go").write_text("package main\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "init"], cwd=tmp_git_repo, check=True)
+
+        (tmp_git_repo / "my file.go").write_text("package main\n\nfunc spaced() {}\n")
+        (tmp_git_repo / "ö.go").write_text("package main\n\nfunc umlaut() {}\n")
+
+        diffs, _ = await _collect_diffs(tmp_git_repo, "")
+
+        assert diffs.startswith("=== code_changes ===\n")
+        assert "func spaced()" in diffs
+        assert "func umlaut()" in diffs
+
+    async def test_ignores_mnemonic_prefix_config(self, tmp_git_repo):
+        """Test dependency diffs are split even with diff.mnemonicPrefix set."""
+        import subprocess
+
+        subprocess.run(
+            ["git", "config", "diff.mnemonicPrefix", "true"], cwd=tmp_git_repo, check=True
+        )
+        (tmp_git_repo / "go.mod").write_text("module svc\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "init"], cwd=tmp_git_repo, check=True)
+
+        (tmp_git_repo / "go.mod").write_text("module svc\n\ngo 1.23\n")
+
+        diffs, _ = await _collect_diffs(tmp_git_repo, "")
+
+        assert diffs.startswith("=== go.mod ===\n")
+        assert "go 1.23" in diffs
+
+
+class TestRunGitCommand:
+    """Tests for _run_git_command function."""
+
+    async def test_invalid_utf8_is_replaced(self, tmp_git_repo):
+        """Test non-UTF-8 bytes in git output do not raise."""
+        import subprocess
+
+        (tmp_git_repo / "latin1.txt").write_bytes(b"caf\xe9\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_git_repo, check=True)
+
+        output = await _run_git_command(["diff", "--cached", "--no-color"], tmp_git_repo)
+
+        assert "caf\ufffd" in output
+
+
+class TestBackoffDelay:
+    """Tests for _backoff_delay function."""
+
+    def test_jitters_base_delay(self):
+        """Test the base delay is jittered within ±25%."""
+        delays = {_backoff_delay(1, "connection reset") for _ in range(20)}
+
+        assert all(3.75 <= delay <= 6.25 for delay in delays)
+        assert len(delays) > 1
+
+    def test_prefers_retry_after_hint(self):
+        """Test a retry-after hint in the error overrides the base delay."""
+        assert _backoff_delay(0, "429 Too Many Requests, Retry-After: 30") == 30.0
+
+    def test_caps_retry_after_hint(self):
+        """Test a large retry-after hint is capped instead of stalling the run."""
+        assert _backoff_delay(0, "429 Too Many Requests, Retry-After: 3600") == 60.0
+
+
+class TestExtractJson:
+    """Tests for _extract_json function."""
+
+    def test_code_block_preferred_over_braces(self):
+        """Test a fenced block wins even when braces appear earlier in the text."""
+        text = 'Format {like this}:\n```json\n{"version_bump": "minor"}\n```'
+
+        assert _extract_json(text) == '{"version_bump": "minor"}'
 
-            # Verify sleep was called with correct delay
-            mock_sleep.assert_called_once_with(0.5)
+    def test_no_json_returns_input(self):
+        """Test text without fences or braces is returned unchanged."""
+        assert _extract_json("no json here") == "no json here"
 
 
 class TestVerifyClaudeAuth:
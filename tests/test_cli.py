@@ -1,11 +1,25 @@
 """Tests for CLI orchestration and workflow."""
 
+import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from updater import config
-from updater.cli import main_async, process_module_with_retry, process_single_go_module
+from updater.cli import (
+    main_async,
+    main_go_only_async,
+    print_commit_summary,
+    print_summary,
+    process_module_with_retry,
+    process_modules_concurrently,
+    process_single_go_module,
+    run_grouped_by_repo,
+    update_dockerfiles,
+    update_git_repositories,
+)
+from updater.log_manager import log_message
 
 
 @pytest.fixture
@@ -15,9 +29,9 @@ def reset_config():
     config.MODEL = "sonnet"
     config.REQUIRE_CONFIRM = False
     config.RUN_TIMESTAMP = "2024-01-01-120000"
-    config.LOG_FILE_HANDLE = None
+    config.LOG_FILE_HANDLE.set(None)
     yield
-    config.LOG_FILE_HANDLE = None
+    config.LOG_FILE_HANDLE.set(None)
 
 
 @pytest.fixture
@@ -30,6 +44,50 @@ def mock_module_path(tmp_path):
     return module_path
 
 
+class TestPrintCommitSummary:
+    """Tests for print_commit_summary function."""
+
+    def test_versioned_summary(self, capsys):
+        """Test the summary lists version, tag and changelog entries."""
+        analysis = {
+            "version_bump": "patch",
+            "commit_message": "update deps",
+            "changelog": ["- Update foo", "Update bar"],
+        }
+
+        print_commit_summary("mod", analysis, new_version="v1.0.1", note="Check it")
+
+        out = capsys.readouterr().out
+        assert out == (
+            "\n" + "=" * 60 + "\nREADY TO COMMIT: mod\n" + "=" * 60 + "\n"
+            "Version:        v1.0.1 (patch bump)\n"
+            "Commit message: update deps\n"
+            "Git tag:        v1.0.1 (will be created)\n"
+            "\nChangelog entries:\n"
+            "  - Update foo\n"
+            "  - Update bar\n"
+            "\nNote: Check it\n" + "=" * 60 + "\n"
+        )
+
+
+class TestPrintSummary:
+    """Tests for print_summary function."""
+
+    def test_lists_non_empty_sections(self, tmp_path, capsys):
+        """Test only sections with modules are printed, each with its modules."""
+        print_summary(
+            "SUMMARY: 3 module(s)",
+            [(tmp_path / "a", "updated"), (tmp_path / "c", "skipped"), (tmp_path / "b", "updated")],
+            [("updated", "✓ Updated"), ("failed", "✗ Failed")],
+        )
+
+        assert capsys.readouterr().out == (
+            "\n" + "=" * 70 + "\nSUMMARY: 3 module(s)\n" + "=" * 70 + "\n"
+            "\n✓ Updated: 2\n  - a\n  - b\n"
+            "\n" + "=" * 70 + "\n"
+        )
+
+
 class TestProcessSingleModule:
     """Tests for process_single_go_module function."""
 
@@ -55,7 +113,11 @@ class TestProcessSingleModule:
             patch("updater.pipeline.update_versions", return_value=False),
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
-            patch("updater.pipeline.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
+                return_value=(0, []),
+            ),
             patch("updater.cli.close_module_logging"),
             patch("updater.cli.cleanup_old_logs"),
         ):
@@ -74,7 +136,11 @@ class TestProcessSingleModule:
             patch("updater.pipeline.update_versions", return_value=True),
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
-            patch("updater.pipeline.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
+                return_value=(0, []),
+            ),
             patch("updater.cli.close_module_logging"),
             patch("updater.cli.cleanup_old_logs"),
         ):
@@ -104,7 +170,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(2, ["go.mod", "go.sum"]), (2, ["go.mod", "go.sum"])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -142,7 +209,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(2, ["go.mod", "go.sum"]), (2, ["go.mod", "go.sum"])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -178,7 +246,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(1, [".gitignore"]), (1, [".gitignore"])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -232,7 +301,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(2, ["go.mod", "go.sum"]), (2, ["go.mod", "go.sum"])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -275,7 +345,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.apply_gomod_excludes_and_replaces", return_value=False),
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(2, ["go.mod", "go.sum"]), (2, ["go.mod", "go.sum"])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -308,7 +379,8 @@ class TestProcessSingleModule:
             patch("updater.pipeline.update_go_dependencies", return_value=False),
             # First check shows changes, precommit runs, second check shows no changes
             patch(
-                "updater.pipeline.check_git_status",
+                "updater.pipeline.check_git_status_async",
+                new_callable=AsyncMock,
                 side_effect=[(2, ["go.mod", "go.sum"]), (0, [])],
             ),
             patch("updater.pipeline.run_go_precommit"),
@@ -392,6 +464,176 @@ class TestProcessModuleWithRetry:
         assert status == "updated"
 
 
+class TestProcessModulesConcurrently:
+    """Tests for process_modules_concurrently function."""
+
+    @pytest.mark.asyncio
+    async def test_repos_overlap_and_results_keep_order(self, tmp_path):
+        """Test separate repos run concurrently, same-repo modules run serially."""
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        modules = [(repo_a / "m1", "go"), (repo_a / "m2", "go"), (repo_b / "m3", "python")]
+        running: set[Path] = set()
+        overlaps: list[set[Path]] = []
+
+        async def fake_process(module_path, project_type="go"):
+            running.add(module_path)
+            await asyncio.sleep(0.01)
+            overlaps.append(set(running))
+            running.discard(module_path)
+            return (True, f"done-{module_path.name}")
+
+        with (
+            patch("updater.cli.find_git_repo", side_effect=lambda m: m.parent),
+            patch("updater.cli.process_module_with_retry", side_effect=fake_process),
+            patch("builtins.print"),
+        ):
+            results = await process_modules_concurrently(modules, jobs=2)
+
+        assert [(mod, status) for mod, _, status, _ in results] == [
+            (repo_a / "m1", "done-m1"),
+            (repo_a / "m2", "done-m2"),
+            (repo_b / "m3", "done-m3"),
+        ]
+        assert {repo_a / "m1", repo_b / "m3"} in overlaps
+        assert all(not {repo_a / "m1", repo_a / "m2"} <= seen for seen in overlaps)
+
+
+class TestRunGroupedByRepo:
+    """Tests for run_grouped_by_repo function."""
+
+    @pytest.mark.asyncio
+    async def test_stop_on_failure_starts_no_further_modules(self, tmp_path):
+        """Test no module starts after one has failed when stop_on_failure is set."""
+        modules = [tmp_path / "m1", tmp_path / "m2", tmp_path / "m3"]
+        process = AsyncMock(side_effect=[(True, "updated"), (False, "skipped"), (True, "updated")])
+
+        with patch("updater.cli.find_git_repo", return_value=tmp_path):
+            results = await run_grouped_by_repo(modules, 1, process, stop_on_failure=True)
+
+        assert results == [
+            (tmp_path / "m1", True, "updated"),
+            (tmp_path / "m2", False, "skipped"),
+        ]
+        assert process.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_continues_after_failure_by_default(self, tmp_path):
+        """Test all modules are processed when stop_on_failure is not set."""
+        modules = [tmp_path / "m1", tmp_path / "m2"]
+        process = AsyncMock(side_effect=[(False, "failed"), (True, "updated")])
+
+        with patch("updater.cli.find_git_repo", return_value=tmp_path):
+            results = await run_grouped_by_repo(modules, 1, process)
+
+        assert [status for _, _, status in results] == ["failed", "updated"]
+
+    @pytest.mark.asyncio
+    async def test_single_job_keeps_input_order_across_repos(self, tmp_path):
+        """Test jobs=1 processes modules in the given order, not grouped by repo."""
+        modules = [tmp_path / "A" / "g1", tmp_path / "B" / "g2", tmp_path / "A" / "p1"]
+        calls = []
+
+        async def process(i, mod):
+            calls.append(i)
+            return True, "updated"
+
+        with patch("updater.cli.find_git_repo", side_effect=lambda mod: mod.parent):
+            await run_grouped_by_repo(modules, 1, process)
+
+        assert calls == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_exception_fails_only_that_module(self, tmp_path):
+        """Test an exception in one module doesn't cancel other repositories."""
+        modules = [tmp_path / "a", tmp_path / "b"]
+
+        async def process(i, mod):
+            if mod.name == "a":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0)
+            return True, "updated"
+
+        with (
+            patch("updater.cli.find_git_repo", side_effect=lambda mod: mod),
+            patch("updater.cli.write_console"),
+        ):
+            results = await run_grouped_by_repo(modules, 2, process)
+
+        assert results == [(modules[0], False, "failed"), (modules[1], True, "updated")]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_modules_print_whole_blocks(self, tmp_path, capsys):
+        """Test output of modules in different repos doesn't interleave with jobs > 1."""
+        modules = [tmp_path / "a", tmp_path / "b"]
+
+        async def process(i, mod):
+            log_message(f"{mod.name} start", to_console=True)
+            await asyncio.sleep(0)
+            log_message(f"{mod.name} end", to_console=True)
+            return True, "updated"
+
+        with patch("updater.cli.find_git_repo", side_effect=lambda mod: mod):
+            await run_grouped_by_repo(modules, 2, process)
+
+        out = capsys.readouterr().out
+        assert "a start\na end\n" in out
+        assert "b start\nb end\n" in out
+
+
+class TestUpdateGitRepositories:
+    """Tests for update_git_repositories function."""
+
+    @pytest.mark.asyncio
+    async def test_output_in_order_and_failures_collected(self, tmp_path):
+        """Test buffered output is printed per repo in order and failures returned."""
+        repos = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+
+        def fake_update(repo, log_func):
+            log_func(f"  → updating {repo.name}", to_console=True)
+            return repo.name != "b"
+
+        with (
+            patch("updater.cli.update_git_branch", side_effect=fake_update),
+            patch("builtins.print") as mock_print,
+        ):
+            failed = await update_git_repositories(repos)
+
+        assert failed == [tmp_path / "b"]
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        assert printed == [
+            "→ a",
+            "  → updating a",
+            "→ b",
+            "  → updating b",
+            "→ c",
+            "  → updating c",
+        ]
+
+
+class TestUpdateDockerfiles:
+    """Tests for update_dockerfiles function."""
+
+    @pytest.mark.asyncio
+    async def test_output_in_order_and_any_update_reported(self, tmp_path, reset_config):
+        """Test buffered output is printed per Dockerfile in order."""
+        dirs = [tmp_path / "a", tmp_path / "b"]
+
+        def fake_update(directory, log_func):
+            log_func(f"  golang → {directory.name}", to_console=True)
+            log_func("  debug detail", to_console=False)
+            return directory.name == "b", []
+
+        with (
+            patch("updater.cli.update_dockerfile_images", side_effect=fake_update),
+            patch("builtins.print") as mock_print,
+        ):
+            any_updates = await update_dockerfiles(dirs)
+
+        assert any_updates is True
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        assert printed == [f"\n→ {dirs[0]}", "  golang → a", f"\n→ {dirs[1]}", "  golang → b"]
+
+
 class TestMainAsync:
     """Tests for main_async function."""
 
@@ -425,6 +667,25 @@ class TestMainAsync:
 
         assert exit_code == 1
 
+    @pytest.mark.asyncio
+    async def test_path_below_regular_file(self, tmp_path, reset_config):
+        """Test a path through a regular file is reported instead of raising."""
+        regular_file = tmp_path / "file.txt"
+        regular_file.write_text("not a directory\n")
+
+        with (
+            patch("sys.argv", ["update-deps", str(regular_file / "x")]),
+            patch(
+                "updater.cli.verify_claude_auth", new_callable=AsyncMock, return_value=(True, None)
+            ),
+            patch("updater.cli.play_completion_sound"),
+            patch("builtins.print") as mock_print,
+        ):
+            exit_code = await main_async()
+
+        assert exit_code == 1
+        mock_print.assert_any_call(f"✗ Path does not exist: {regular_file / 'x'}")
+
     @pytest.mark.asyncio
     async def test_single_module_success(self, mock_module_path, reset_config):
         """Test successful processing of single module."""
@@ -435,7 +696,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -458,7 +723,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -478,7 +747,11 @@ class TestMainAsync:
             patch("sys.argv", ["update-deps", str(mock_module_path)]),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=False),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.verify_claude_auth", new_callable=AsyncMock, return_value=(True, None)
             ),
@@ -500,7 +773,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(2, ["go.mod", "go.sum"])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(2, ["go.mod", "go.sum"])] * len(paths),
+            ),
             patch("updater.cli.prompt_yes_no", return_value=False),
             patch("updater.cli.play_completion_sound"),
             patch("builtins.print"),
@@ -519,7 +796,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(2, ["go.mod", "go.sum"])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(2, ["go.mod", "go.sum"])] * len(paths),
+            ),
             patch("updater.cli.prompt_yes_no", return_value=True),
             patch(
                 "updater.cli.process_module_with_retry",
@@ -552,7 +833,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=tmp_path),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -565,6 +850,38 @@ class TestMainAsync:
 
         assert exit_code == 0
 
+    @pytest.mark.asyncio
+    async def test_multi_module_summary_common_path(self, tmp_path, reset_config, capsys):
+        """Test the summary names the deepest directory containing all modules."""
+        mods = [tmp_path / "a" / "mod1", tmp_path / "a" / "b" / "mod2"]
+        for mod in mods:
+            mod.mkdir(parents=True)
+            (mod / "go.mod").write_text("module m\n")
+
+        with (
+            patch("sys.argv", ["update-deps", *map(str, mods)]),
+            patch(
+                "updater.cli.verify_claude_auth", new_callable=AsyncMock, return_value=(True, None)
+            ),
+            patch("updater.cli.find_git_repo", return_value=tmp_path),
+            patch("updater.cli.update_git_branch", return_value=True),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
+            patch(
+                "updater.cli.process_module_with_retry",
+                new_callable=AsyncMock,
+                return_value=(True, "updated"),
+            ),
+            patch("updater.cli.play_completion_sound"),
+        ):
+            exit_code = await main_async()
+
+        assert exit_code == 0
+        assert f"SUMMARY: 2 module(s) in {tmp_path / 'a'}" in capsys.readouterr().out
+
     @pytest.mark.asyncio
     async def test_verbose_mode(self, mock_module_path, reset_config):
         """Test verbose mode sets config correctly."""
@@ -575,7 +892,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -596,7 +917,11 @@ class TestMainAsync:
             patch("sys.argv", ["update-deps", str(mock_module_path), "--model", "haiku"]),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.verify_claude_auth", new_callable=AsyncMock, return_value=(True, None)
             ),
@@ -624,7 +949,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=mock_module_path.parent),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -662,7 +991,11 @@ class TestMainAsync:
             ),
             patch("updater.cli.find_git_repo", return_value=tmp_path),
             patch("updater.cli.update_git_branch", return_value=True),
-            patch("updater.cli.check_git_status", return_value=(0, [])),
+            patch(
+                "updater.cli.check_git_status_many_async",
+                new_callable=AsyncMock,
+                side_effect=lambda paths: [(0, [])] * len(paths),
+            ),
             patch(
                 "updater.cli.process_module_with_retry",
                 new_callable=AsyncMock,
@@ -674,3 +1007,65 @@ class TestMainAsync:
             exit_code = await main_async()
 
         assert exit_code == 0
+
+
+class TestMainGoOnlyAsync:
+    """Tests for the update-go-only entry point."""
+
+    @pytest.mark.asyncio
+    async def test_processes_without_dependency_updates(self, mock_module_path, reset_config):
+        """Test modules are processed with update_deps=False and options applied."""
+        with (
+            patch("sys.argv", ["update-go-only", str(mock_module_path), "--model", "haiku"]),
+            patch(
+                "updater.cli.process_module_with_retry",
+                new_callable=AsyncMock,
+                return_value=(True, "updated"),
+            ) as mock_process,
+            patch("updater.cli.play_completion_sound"),
+            patch("builtins.print"),
+        ):
+            exit_code = await main_go_only_async()
+
+        assert exit_code == 0
+        assert config.MODEL == "haiku"
+        mock_process.assert_awaited_once_with(
+            mock_module_path, project_type="go", update_deps=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_searches_parent_directories(self, tmp_path, mock_module_path, reset_config):
+        """Test module and parent directory arguments are combined in argument order."""
+        parent = tmp_path / "repo"
+        nested = parent / "svc"
+        nested.mkdir(parents=True)
+        (nested / "go.mod").write_text("module svc\n")
+
+        with (
+            patch("sys.argv", ["update-go-only", str(parent), str(mock_module_path)]),
+            patch(
+                "updater.cli.process_module_with_retry",
+                new_callable=AsyncMock,
+                return_value=(True, "updated"),
+            ) as mock_process,
+            patch("updater.cli.play_completion_sound"),
+            patch("builtins.print"),
+        ):
+            exit_code = await main_go_only_async()
+
+        assert exit_code == 0
+        processed = [call.args[0] for call in mock_process.await_args_list]
+        assert processed == [nested, mock_module_path]
+
+    @pytest.mark.asyncio
+    async def test_nonexistent_path(self, tmp_path, reset_config):
+        """Test a missing path argument fails before discovery."""
+        with (
+            patch("sys.argv", ["update-go-only", str(tmp_path / "missing")]),
+            patch("updater.cli.process_module_with_retry", new_callable=AsyncMock) as mock_process,
+            patch("builtins.print"),
+        ):
+            exit_code = await main_go_only_async()
+
+        assert exit_code == 1
+        mock_process.assert_not_awaited()
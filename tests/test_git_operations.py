@@ -1,95 +1,78 @@
 """Tests for git operations."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import pytest
+
+from updater import git_operations
 from updater.git_operations import (
-    check_git_status,
+    _parse_git_status,
+    check_git_status_async,
+    check_git_status_many_async,
     get_commits_since_tag,
     get_latest_tag,
     git_push,
 )
 
 
-def test_check_git_status_no_changes(tmp_path):
-    """Test check_git_status with no changes."""
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=0, stdout="")
-
-        count, files = check_git_status(tmp_path)
+def test_parse_git_status_no_changes(tmp_path):
+    """Test _parse_git_status with no changes."""
+    count, files = _parse_git_status("", tmp_path, tmp_path)
 
-        assert count == 0
-        assert files == []
+    assert count == 0
+    assert files == []
 
 
-def test_check_git_status_with_changes(tmp_path):
-    """Test check_git_status with modified files."""
+def test_parse_git_status_with_changes(tmp_path):
+    """Test _parse_git_status with modified files."""
     # Simulate git status --porcelain output
     git_output = " M go.mod\n M go.sum\n?? newfile.txt\n"
 
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=0, stdout=git_output)
-
-        count, files = check_git_status(tmp_path)
+    count, files = _parse_git_status(git_output, tmp_path, tmp_path)
 
-        assert count == 3
-        assert files == ["go.mod", "go.sum", "newfile.txt"]
+    assert count == 3
+    assert files == ["go.mod", "go.sum", "newfile.txt"]
 
 
-def test_check_git_status_with_spaces_in_filename(tmp_path):
-    """Test check_git_status with filenames containing spaces."""
+def test_parse_git_status_with_spaces_in_filename(tmp_path):
+    """Test _parse_git_status with filenames containing spaces."""
     git_output = " M file with spaces.go\n"
 
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=0, stdout=git_output)
-
-        count, files = check_git_status(tmp_path)
+    count, files = _parse_git_status(git_output, tmp_path, tmp_path)
 
-        assert count == 1
-        # Note: git status --porcelain doesn't preserve spaces in simple format
-        # This test documents current behavior
-        assert files == ["file"]
+    assert count == 1
+    # Note: git status --porcelain doesn't preserve spaces in simple format
+    # This test documents current behavior
+    assert files == ["file"]
 
 
-def test_check_git_status_error(tmp_path):
-    """Test check_git_status with git command error."""
+@pytest.mark.asyncio
+async def test_check_git_status_async_error(tmp_path):
+    """Test check_git_status_async with git command error."""
     with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
+        patch("updater.git_operations.find_git_repo", return_value=tmp_path),
+        patch("updater.git_operations._git_status_output", new_callable=AsyncMock) as mock_output,
     ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="fatal: not a git repository")
-
-        count, files = check_git_status(tmp_path)
+        mock_output.return_value = None
 
-        assert count == -1
-        assert files == []
+        count, files = await check_git_status_async(tmp_path)
 
+    assert count == -1
+    assert files == []
 
-def test_check_git_status_no_git_repo(tmp_path):
-    """Test check_git_status when not in a git repository."""
-    with patch("updater.git_operations.find_git_repo") as mock_find:
-        mock_find.return_value = None
 
-        count, files = check_git_status(tmp_path)
+@pytest.mark.asyncio
+async def test_check_git_status_async_no_git_repo(tmp_path):
+    """Test check_git_status_async when not in a git repository."""
+    with patch("updater.git_operations.find_git_repo", return_value=None):
+        count, files = await check_git_status_async(tmp_path)
 
-        assert count == -1
-        assert files == []
+    assert count == -1
+    assert files == []
 
 
-def test_check_git_status_various_status_codes(tmp_path):
-    """Test check_git_status with various git status codes."""
+def test_parse_git_status_various_status_codes(tmp_path):
+    """Test _parse_git_status with various git status codes."""
     git_output = """M  staged.go
  M unstaged.go
 MM both.go
@@ -98,28 +81,21 @@ D  deleted.go
 ?? untracked.go
 """
 
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=0, stdout=git_output)
-
-        count, files = check_git_status(tmp_path)
+    count, files = _parse_git_status(git_output, tmp_path, tmp_path)
 
-        assert count == 6
-        assert files == [
-            "staged.go",
-            "unstaged.go",
-            "both.go",
-            "added.go",
-            "deleted.go",
-            "untracked.go",
-        ]
+    assert count == 6
+    assert files == [
+        "staged.go",
+        "unstaged.go",
+        "both.go",
+        "added.go",
+        "deleted.go",
+        "untracked.go",
+    ]
 
 
-def test_check_git_status_subdirectory_filters(tmp_path):
-    """Test check_git_status filters to only show changes in subdirectory."""
+def test_parse_git_status_subdirectory_filters(tmp_path):
+    """Test _parse_git_status filters to only show changes in subdirectory."""
     # Setup: Create a mock monorepo structure
     repo_root = tmp_path / "repo"
     module_path = repo_root / "skeleton"
@@ -131,22 +107,15 @@ M  k8s/gcp-snapshot-schedule-manager/go.mod
 M  raw/schema-v1/pipe-controller/go.mod
 """
 
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = repo_root
-        mock_run.return_value = Mock(returncode=0, stdout=git_output)
-
-        count, files = check_git_status(module_path)
+    count, files = _parse_git_status(git_output, module_path, repo_root)
 
-        # Should only include files in skeleton/
-        assert count == 2
-        assert files == ["skeleton/go.mod", "skeleton/main.go"]
+    # Should only include files in skeleton/
+    assert count == 2
+    assert files == ["skeleton/go.mod", "skeleton/main.go"]
 
 
-def test_check_git_status_excludes_vendor(tmp_path):
-    """Test check_git_status excludes vendor/ directory files."""
+def test_parse_git_status_excludes_vendor(tmp_path):
+    """Test _parse_git_status excludes vendor/ directory files."""
     git_output = """M  go.mod
 M  go.sum
 M  main.go
@@ -155,18 +124,46 @@ M  vendor/modules.txt
 M  skeleton/vendor/github.com/baz/file.go
 """
 
-    with (
-        patch("updater.git_operations.find_git_repo") as mock_find,
-        patch("subprocess.run") as mock_run,
-    ):
-        mock_find.return_value = tmp_path
-        mock_run.return_value = Mock(returncode=0, stdout=git_output)
+    count, files = _parse_git_status(git_output, tmp_path, tmp_path)
+
+    # Should exclude all vendor/ files
+    assert count == 3
+    assert files == ["go.mod", "go.sum", "main.go"]
+
+
+@pytest.mark.asyncio
+async def test_check_git_status_async(tmp_git_repo):
+    """Test check_git_status_async reports changes within a subdirectory."""
+    module_path = tmp_git_repo / "module"
+    module_path.mkdir()
+    (module_path / "go.mod").write_text("module test\n")
+    (tmp_git_repo / "other.txt").write_text("x\n")
+
+    count, files = await check_git_status_async(module_path)
+
+    assert count == 1
+    assert files == ["module/"]
+
+
+@pytest.mark.asyncio
+async def test_check_git_status_many_async_runs_git_once_per_repo(tmp_git_repo, tmp_path):
+    """Test modules sharing a repo share one git status and get filtered results."""
+    for name in ("a", "b"):
+        (tmp_git_repo / name).mkdir()
+    (tmp_git_repo / "a" / "go.mod").write_text("module a\n")
+    outside = tmp_path / "outside"
+    outside.mkdir()
 
-        count, files = check_git_status(tmp_path)
+    with patch(
+        "updater.git_operations._git_status_output",
+        wraps=git_operations._git_status_output,
+    ) as mock_output:
+        results = await check_git_status_many_async(
+            [tmp_git_repo / "a", tmp_git_repo / "b", outside]
+        )
 
-        # Should exclude all vendor/ files
-        assert count == 3
-        assert files == ["go.mod", "go.sum", "main.go"]
+    assert results == [(1, ["a/"]), (0, []), (-1, [])]
+    assert mock_output.call_count == 1
 
 
 def test_git_push_calls_push_and_tags(tmp_path):
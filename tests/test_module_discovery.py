@@ -5,8 +5,10 @@ import pytest
 from updater.module_discovery import (
     _module_sort_key,
     discover_docker_projects,
+    discover_dockerfile_dirs,
     discover_go_modules,
     discover_legacy_python_projects,
+    marker_files,
 )
 
 
@@ -552,3 +554,35 @@ class TestDiscoverLegacyPythonProjects:
         projects = discover_legacy_python_projects(tmp_path, recursive=True)
 
         assert len(projects) == 0
+
+
+def test_marker_files_lists_entries(tmp_path):
+    """Test marker_files returns the names of files and directories in a directory."""
+    (tmp_path / "go.mod").write_text("module test\n")
+    (tmp_path / "sub").mkdir()
+
+    assert marker_files(tmp_path) == {"go.mod", "sub"}
+
+
+def test_marker_files_missing_directory(tmp_path):
+    """Test marker_files returns an empty set for an unreadable path."""
+    assert marker_files(tmp_path / "missing") == set()
+
+
+def test_discover_dockerfile_dirs_includes_modules_and_skips_venv(tmp_path):
+    """Test every Dockerfile directory is found, except under .venv."""
+    service = tmp_path / "service"
+    service.mkdir()
+    (service / "go.mod").write_text("module service\n")
+    (service / "Dockerfile").write_text("FROM golang:1.23\n")
+    tool = tmp_path / "tools" / "builder"
+    tool.mkdir(parents=True)
+    (tool / "Dockerfile").write_text("FROM alpine:3.20\n")
+    vendored = tmp_path / "vendor" / "lib"
+    vendored.mkdir(parents=True)
+    (vendored / "Dockerfile").write_text("FROM alpine:3.20\n")
+    venv_pkg = tmp_path / ".venv" / "pkg"
+    venv_pkg.mkdir(parents=True)
+    (venv_pkg / "Dockerfile").write_text("FROM python:3.12\n")
+
+    assert discover_dockerfile_dirs(tmp_path) == [service, tool, vendored]
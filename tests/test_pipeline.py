@@ -2,6 +2,8 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from updater.pipeline import (
     CheckChangesStep,
     DockerCommitStep,
@@ -120,7 +122,9 @@ async def test_pipeline_git_confirm_skip_returns_early(tmp_path):
 
 async def test_check_changes_step_no_changes(tmp_path):
     """Test CheckChangesStep returns UP_TO_DATE when no changes."""
-    with patch("updater.pipeline.check_git_status", return_value=(0, [])):
+    with patch(
+        "updater.pipeline.check_git_status_async", new_callable=AsyncMock, return_value=(0, [])
+    ):
         with patch("updater.pipeline.log_message"):
             step = CheckChangesStep()
             ctx = {}
@@ -131,7 +135,11 @@ async def test_check_changes_step_no_changes(tmp_path):
 
 async def test_check_changes_step_with_changes(tmp_path):
     """Test CheckChangesStep returns SUCCESS when changes exist."""
-    with patch("updater.pipeline.check_git_status", return_value=(2, ["go.mod", "go.sum"])):
+    with patch(
+        "updater.pipeline.check_git_status_async",
+        new_callable=AsyncMock,
+        return_value=(2, ["go.mod", "go.sum"]),
+    ):
         with patch("updater.pipeline.log_message"):
             with patch("updater.pipeline.condense_file_list", return_value=["go.mod", "go.sum"]):
                 step = CheckChangesStep()
@@ -145,7 +153,9 @@ async def test_check_changes_step_with_changes(tmp_path):
 
 async def test_check_changes_step_precommit_phase_no_changes(tmp_path):
     """Test CheckChangesStep in precommit phase with no changes."""
-    with patch("updater.pipeline.check_git_status", return_value=(0, [])):
+    with patch(
+        "updater.pipeline.check_git_status_async", new_callable=AsyncMock, return_value=(0, [])
+    ):
         with patch("updater.pipeline.log_message"):
             step = CheckChangesStep(phase="precommit")
             ctx = {"updates_made": True}
@@ -154,6 +164,25 @@ async def test_check_changes_step_precommit_phase_no_changes(tmp_path):
             assert result.status == StepStatus.UP_TO_DATE
 
 
+@pytest.mark.parametrize(
+    ("phase", "updates_made", "include_untracked"),
+    [
+        ("update", True, True),
+        ("precommit", True, False),
+        ("precommit", False, True),
+    ],
+)
+async def test_check_changes_step_untracked_files(tmp_path, phase, updates_made, include_untracked):
+    """Test untracked files are only skipped after precommit on a fresh update."""
+    with patch(
+        "updater.pipeline.check_git_status_async", new_callable=AsyncMock, return_value=(0, [])
+    ) as mock_status:
+        with patch("updater.pipeline.log_message"):
+            await CheckChangesStep(phase=phase).run(tmp_path, {"updates_made": updates_made})
+
+    mock_status.assert_awaited_once_with(tmp_path, include_untracked=include_untracked)
+
+
 # ---------------------------------------------------------------------------
 # ReleaseStep
 # ---------------------------------------------------------------------------
@@ -235,7 +264,9 @@ async def test_docker_commit_step_no_updates(tmp_path):
 async def test_docker_commit_step_no_git_changes(tmp_path):
     """Test DockerCommitStep returns UP_TO_DATE when git has no changes."""
     with (
-        patch("updater.pipeline.check_git_status", return_value=(0, [])),
+        patch(
+            "updater.pipeline.check_git_status_async", new_callable=AsyncMock, return_value=(0, [])
+        ),
         patch("updater.pipeline.log_message"),
     ):
         step = DockerCommitStep()
@@ -248,7 +279,11 @@ async def test_docker_commit_step_no_git_changes(tmp_path):
 async def test_docker_commit_step_with_changes(tmp_path):
     """Test DockerCommitStep commits when there are changes."""
     with (
-        patch("updater.pipeline.check_git_status", return_value=(1, ["Dockerfile"])),
+        patch(
+            "updater.pipeline.check_git_status_async",
+            new_callable=AsyncMock,
+            return_value=(1, ["Dockerfile"]),
+        ),
         patch("updater.pipeline.git_commit") as mock_commit,
         patch("updater.pipeline.log_message"),
     ):
@@ -261,6 +296,25 @@ async def test_docker_commit_step_with_changes(tmp_path):
         assert "nginx:1.25→1.26" in mock_commit.call_args[0][1]
 
 
+async def test_docker_commit_step_multiple_updates_message(tmp_path):
+    """Test DockerCommitStep lists multiple image updates in the commit body."""
+    with (
+        patch(
+            "updater.pipeline.check_git_status_async",
+            new_callable=AsyncMock,
+            return_value=(1, ["Dockerfile"]),
+        ),
+        patch("updater.pipeline.git_commit") as mock_commit,
+        patch("updater.pipeline.log_message"),
+    ):
+        ctx = {"docker_updates": ["nginx:1.25→1.26", "alpine:3.19→3.20"]}
+        await DockerCommitStep().run(tmp_path, ctx)
+
+        assert mock_commit.call_args[0][1] == (
+            "Update Dockerfile images\n\n- nginx:1.25→1.26\n- alpine:3.19→3.20"
+        )
+
+
 # ---------------------------------------------------------------------------
 # ReleaseStep - missing tag detection
 # ---------------------------------------------------------------------------
@@ -0,0 +1,65 @@
+"""Tests for user input prompts."""
+
+import asyncio
+import threading
+
+import pytest
+
+from updater import config
+from updater.prompts import ask
+
+
+@pytest.fixture
+def parallel():
+    """Run with several git repositories in flight."""
+    config.MAX_PARALLEL = 2
+    yield
+    config.MAX_PARALLEL = 1
+
+
+@pytest.mark.asyncio
+async def test_ask_keeps_event_loop_running(parallel):
+    """Test a waiting prompt doesn't block other tasks on the event loop."""
+    answered = threading.Event()
+
+    def blocking_prompt(message):
+        assert answered.wait(timeout=5)
+        return f"{message}: yes"
+
+    async def other_module():
+        await asyncio.sleep(0)
+        answered.set()
+
+    answer, _ = await asyncio.gather(ask(blocking_prompt, "Proceed?"), other_module())
+
+    assert answer == "Proceed?: yes"
+
+
+@pytest.mark.asyncio
+async def test_ask_serializes_prompts(parallel):
+    """Test concurrent prompts are asked one at a time."""
+    active = 0
+    overlaps = []
+
+    def prompt():
+        nonlocal active
+        active += 1
+        overlaps.append(active)
+        threading.Event().wait(0.01)
+        active -= 1
+        return True
+
+    await asyncio.gather(ask(prompt), ask(prompt), ask(prompt))
+
+    assert overlaps == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_ask_propagates_errors(parallel):
+    """Test an exception raised by the prompt reaches the caller."""
+
+    def failing_prompt():
+        raise EOFError
+
+    with pytest.raises(EOFError):
+        await ask(failing_prompt)
@@ -4,6 +4,9 @@ import pytest
 
 from updater.module_discovery import (
     discover_all_modules,
+    discover_docker_projects,
+    discover_go_modules,
+    discover_legacy_python_projects,
     discover_python_modules,
     is_legacy_python_project,
 )
@@ -255,6 +258,21 @@ class TestDiscoverAllModules:
         # Legacy: legacy-script
         assert len(result["legacy"]) == 1
 
+    def test_recursive_matches_individual_discovery(self, mixed_monorepo):
+        """Test the single-walk recursive result matches each discover_* function."""
+        (mixed_monorepo / "tools").mkdir()
+        (mixed_monorepo / "tools" / "Dockerfile").write_text("FROM alpine\n")
+
+        result = discover_all_modules(mixed_monorepo, recursive=True)
+
+        assert result == {
+            "go": discover_go_modules(mixed_monorepo, recursive=True),
+            "python": discover_python_modules(mixed_monorepo, recursive=True),
+            "docker": discover_docker_projects(mixed_monorepo, recursive=True),
+            "legacy": discover_legacy_python_projects(mixed_monorepo, recursive=True),
+        }
+        assert result["docker"] == [mixed_monorepo / "tools"]
+
     def test_empty_categories_when_none_found(self, tmp_path):
         """Test that empty lists are returned when no modules found."""
         result = discover_all_modules(tmp_path, recursive=True)
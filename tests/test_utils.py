@@ -1,6 +1,8 @@
 """Tests for utility functions."""
 
+from updater.file_utils import condense_file_list
 from updater.git_operations import find_git_repo
+from updater.log_manager import buffered_console, log_message
 from updater.module_discovery import discover_go_modules
 
 
@@ -31,6 +33,50 @@ def test_find_git_repo_not_found(tmp_path):
     assert result is None
 
 
+def test_find_git_repo_cached(tmp_path):
+    """Test find_git_repo reuses the walk for the same resolved path."""
+    (tmp_path / ".git").mkdir()
+    subdir = tmp_path / "subdir"
+    subdir.mkdir()
+
+    assert find_git_repo(subdir) == tmp_path
+    (tmp_path / ".git").rmdir()
+    assert find_git_repo(tmp_path / "subdir" / ".." / "subdir") == tmp_path
+
+
+def test_condense_file_list_groups_vendor():
+    """Test condense_file_list groups vendor files into one line."""
+    files = ["go.mod", "vendor/a.go", "vendor/b.go", "go.sum"]
+
+    assert condense_file_list(files) == ["go.mod", "go.sum", "vendor/** (2 files)"]
+
+
+def test_condense_file_list_limit():
+    """Test condense_file_list returns None once the limit is exceeded."""
+    assert condense_file_list(["a", "b"], limit=2) == ["a", "b"]
+    assert condense_file_list(["a", "b", "c"], limit=2) is None
+    assert condense_file_list(["a", "b", "vendor/x"], limit=2) is None
+
+
+def test_log_message_writes_line(capsys):
+    """Test log_message writes the message as one console line."""
+    log_message("hello", to_console=True)
+
+    assert capsys.readouterr().out == "hello\n"
+
+
+def test_buffered_console_holds_output_until_exit(capsys):
+    """Test buffered_console writes the block's output only when it exits."""
+    with buffered_console():
+        log_message("first", to_console=True)
+        log_message("second", to_console=True)
+        assert capsys.readouterr().out == ""
+
+    assert capsys.readouterr().out == "first\nsecond\n"
+    log_message("after", to_console=True)
+    assert capsys.readouterr().out == "after\n"
+
+
 def test_discover_go_modules_empty(tmp_path):
     """Test discover_go_modules with no modules."""
     result = discover_go_modules(tmp_path)